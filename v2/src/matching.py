@@ -8,7 +8,7 @@ from rich.console import Console
 import csv
 import pandas as pd
 import Levenshtein
-from queue import PriorityQueue
+from bisect import insort
 import hebtokenizer
 
 console = Console()
@@ -121,24 +121,36 @@ def find_word_matches(hebrew_word: str, wordlist: List[str],
     Returns:
         List of matching candidates with metadata
     """
-    if not hebrew_word or not wordlist:
+    if not hebrew_word or not wordlist or num_candidates <= 0:
         return []
 
     try:
-        # Use priority queue to find closest matches
-        pq = PriorityQueue()
+        # Keep only the best num_candidates (distance, word) pairs; once that
+        # many are held, nothing worse than the current worst can enter, so
+        # the cut-off tightens and later distance calls can stop early
+        best = []
+        cutoff = max_distance
 
         for vocab_word in wordlist:
-            distance = Levenshtein.distance(hebrew_word, vocab_word)
-            if distance <= max_distance:
-                pq.put((distance, vocab_word))
+            distance = Levenshtein.distance(hebrew_word, vocab_word, score_cutoff=cutoff)
+            if distance > cutoff:
+                continue
+
+            candidate = (distance, vocab_word)
+            if len(best) < num_candidates:
+                insort(best, candidate)
+            elif candidate < best[-1]:
+                insort(best, candidate)
+                best.pop()
+            else:
+                continue
+
+            if len(best) == num_candidates:
+                cutoff = best[-1][0]
 
         # Extract top candidates
         matches = []
-        count = 0
-        while not pq.empty() and count < num_candidates:
-            distance, vocab_word = pq.get()
-
+        for distance, vocab_word in best:
             match_info = {
                 'heb_word': hebrew_word,
                 'match_word': vocab_word,
@@ -146,7 +158,6 @@ def find_word_matches(hebrew_word: str, wordlist: List[str],
                 'levenshtein_distance': distance
             }
             matches.append(match_info)
-            count += 1
 
         return matches
 
@@ -320,4 +331,46 @@ def generate_matches_csv(matches: List[Dict], output_path: Path) -> bool:
 
     except Exception as e:
         console.print(f"[red]Error generating matches CSV:[/red] {e}")
-        return False
\ No newline at end of file
+        return False
+
+if __name__ == "__main__":
+    # Benchmark find_word_matches end to end against the previous version,
+    # which pushed every in-range word through a PriorityQueue
+    import random
+    import time
+    from queue import PriorityQueue
+
+    def priority_queue_matches(hebrew_word: str, wordlist: List[str], max_distance: int,
+                               num_candidates: int) -> List[Tuple[int, str]]:
+        pq = PriorityQueue()
+        for vocab_word in wordlist:
+            distance = Levenshtein.distance(hebrew_word, vocab_word)
+            if distance <= max_distance:
+                pq.put((distance, vocab_word))
+        return [pq.get() for _ in range(min(num_candidates, pq.qsize()))]
+
+    random.seed(0)
+    letters = [chr(c) for c in range(0x05d0, 0x05eb)]
+
+    def random_word() -> str:
+        return "".join(random.choice(letters) for _ in range(random.randint(2, 8)))
+
+    wordlist = list({random_word() for _ in range(50000)})
+    anki_dict = {word: {'Definition': f"meaning of {word}"} for word in wordlist}
+    queries = [random_word() for _ in range(200)]
+    console.print(f"Synthetic vocabulary: {len(wordlist)} words, {len(queries)} queries")
+
+    for max_distance in (2, 3, 5):
+        start = time.perf_counter()
+        expected = [priority_queue_matches(query, wordlist, max_distance, 2) for query in queries]
+        queue_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        found = [[(match['levenshtein_distance'], match['match_word'])
+                  for match in find_word_matches(query, wordlist, anki_dict, max_distance, 2)]
+                 for query in queries]
+        topk_time = time.perf_counter() - start
+
+        assert found == expected
+        console.print(f"max_distance {max_distance}: PriorityQueue {queue_time * 1000 / len(queries):.2f}ms, "
+                      f"find_word_matches {topk_time * 1000 / len(queries):.2f}ms per query")
@@ -19,7 +19,12 @@ def load_config() -> dict:
         raise typer.Exit(1)
 
     with open(config_path) as f:
-        return yaml.safe_load(f)
+        config = yaml.safe_load(f)
+
+    # AnkiConnect URL, timeouts and retries for every command
+    from src.anki_api import configure_anki_client
+    configure_anki_client(config.get('anki', {}))
+    return config
 
 @app.command()
 def status():
@@ -167,30 +172,34 @@ def apply_tags(
     console.print(f"Loaded {len(approved_matches)} approved matches")
 
     # Apply tags using AnkiConnect
-    from src.anki_api import add_tags_to_cards
+    from src.anki_api import add_tags_to_many_cards
 
     tags_applied = 0
     errors = 0
 
+    card_tags = {}
     for match in approved_matches:
         lesson_tag = f"assimil::L{match['lesson']:02d}"
+        card_tags.setdefault(match['card_id'], []).append(lesson_tag)
 
-        if not dry_run:
-            try:
-                console.print(f"Tagging card {match['card_id']} ({match['heb_word']}) with {lesson_tag}")
-                success = add_tags_to_cards([match['card_id']], [lesson_tag])
-                if success:
-                    console.print(f"  ✓ Success")
-                    tags_applied += 1
-                else:
-                    console.print(f"  ✗ Failed")
-                    errors += 1
-            except Exception as e:
-                console.print(f"  ✗ Error tagging card {match['card_id']}: {e}")
-                errors += 1
-        else:
+        if dry_run:
             console.print(f"Would tag card {match['card_id']} ({match['heb_word']}) with {lesson_tag}")
 
+    if not dry_run:
+        console.print(f"Tagging {len(card_tags)} cards...")
+        try:
+            results = add_tags_to_many_cards(card_tags)
+        except Exception as e:
+            console.print(f"  ✗ Error tagging cards: {e}")
+            results = {card_id: False for card_id in card_tags}
+
+        for card_id, success in results.items():
+            if success:
+                tags_applied += len(card_tags[card_id])
+            else:
+                console.print(f"  ✗ Failed: card {card_id} ({' '.join(card_tags[card_id])})")
+                errors += 1
+
     if dry_run:
         console.print(f"\n[green]Dry run complete[/green]")
         console.print(f"Use --no-dry-run to actually apply tags to {len(approved_matches)} cards")
@@ -200,24 +209,64 @@ def apply_tags(
             console.print(f"[yellow]Errors: {errors}[/yellow]")
 
 
+@app.command()
+def verify_media(
+    fix: bool = typer.Option(False, help="Re-upload files whose Anki copy differs from the local file")
+):
+    """Check Anki's copies of course audio against the local files by size and content hash"""
+    from src.deck_sync import verify_media_files
+
+    config = load_config()
+    results = verify_media_files(config, fix=fix)
+
+    if results['drifted'] and not fix:
+        console.print("[dim]Use --fix to re-upload the differing files[/dim]")
+
 @app.command()
 def storage_status():
     """Show status of persistent storage (approved matches, unmatched words, etc.)"""
-    from src.persistence import PersistenceManager
+    from src.persistence import create_persistence_manager
 
     console.print("[bold blue]Persistent Storage Status[/bold blue]")
 
-    pm = PersistenceManager()
+    pm = create_persistence_manager(load_config())
     pm.print_status()
 
     # Show sample unmatched words if any exist
-    if pm.unmatched_words:
+    sample = pm.get_unmatched_words(limit=5)
+    if sample:
         console.print("\n[yellow]Sample unmatched words:[/yellow]")
-        for i, (key, unmatched) in enumerate(pm.unmatched_words.items()):
-            if i >= 5:  # Show first 5
-                break
+        for unmatched in sample:
             console.print(f"  L{unmatched.lesson:02d}: {unmatched.heb_word} (attempts: {unmatched.attempts})")
 
+@app.command()
+def storage_import():
+    """Load the CSV review files into the SQLite storage backend, replacing its contents"""
+    from src.persistence import SqlitePersistenceManager
+
+    console.print("[bold blue]Importing CSV files into SQLite storage...[/bold blue]")
+
+    pm = SqlitePersistenceManager()
+    counts = pm.import_csv()
+
+    console.print(f"[green]✓[/green] Imported {counts['approved_matches']} approved matches, "
+                  f"{counts['extra_matches']} extra matches, {counts['unmatched_words']} unmatched words")
+    console.print(f"Database: {pm.db_file}")
+
+@app.command()
+def storage_export():
+    """Write the SQLite storage backend back to the CSV review files"""
+    from src.persistence import SqlitePersistenceManager
+
+    console.print("[bold blue]Exporting SQLite storage to CSV files...[/bold blue]")
+
+    pm = SqlitePersistenceManager()
+    counts = pm.export_csv()
+
+    console.print(f"[green]✓[/green] Exported {counts['approved_matches']} approved matches to {pm.approved_file}")
+    console.print(f"[green]✓[/green] Exported {counts['unmatched_words']} unmatched words to {pm.unmatched_file}")
+    console.print("[dim]Run 'storage-import' after editing the files to load the changes back[/dim]")
+
 @app.command()
 def create_extra_template():
     """Create template file for manual extra matches"""
@@ -237,15 +286,17 @@ def import_v1(
     dry_run: bool = typer.Option(True, help="Show what would be imported without saving")
 ):
     """Import V1 approved matches and extra matches into V3 persistence system"""
+    from src.persistence import create_persistence_manager
     from src.v1_importer import import_v1_data
 
     console.print("[bold blue]Importing V1 match data...[/bold blue]")
+    pm = create_persistence_manager(load_config())
 
     if dry_run:
         console.print("[yellow]DRY RUN MODE - No changes will be made[/yellow]")
 
     try:
-        stats = import_v1_data(dry_run=dry_run)
+        stats = import_v1_data(dry_run=dry_run, persistence=pm)
 
         if stats['total_imported'] > 0:
             if dry_run:
@@ -255,8 +306,6 @@ def import_v1(
                 console.print(f"\n[green]✓[/green] Successfully imported {stats['total_imported']} matches from V1")
 
                 # Show updated storage status
-                from src.persistence import PersistenceManager
-                pm = PersistenceManager()
                 pm.print_status()
         else:
             console.print("[yellow]No new matches to import from V1[/yellow]")
@@ -267,9 +316,9 @@ def import_v1(
 @app.command()
 def cache_deck(
     deck_name: str = typer.Option(None, help="Specific deck to cache (default: from config)"),
-    force: bool = typer.Option(False, help="Force refresh even if cache is valid")
+    force: bool = typer.Option(False, help="Re-download the whole deck instead of refreshing incrementally")
 ):
-    """Cache Anki deck data locally for fast matching"""
+    """Cache Anki deck data locally for fast matching (refreshes only edited notes when cached)"""
     from src.deck_cache import DeckCache
 
     config = load_config()
@@ -282,21 +331,22 @@ def cache_deck(
 
     if force or not cache.is_cache_valid(deck_name):
         result = cache.cache_deck(deck_name)
+    else:
+        result = cache.refresh_deck(deck_name)
 
-        if result['success']:
+    if result['success']:
+        if 'updated' in result:
+            console.print(f"[green]✓[/green] Refreshed cache: {result['updated']} cards updated, "
+                          f"{result['removed']} removed, {result['hebrew_cards']} Hebrew cards")
+        else:
             console.print(f"[green]✓[/green] Cached {result['hebrew_cards']} Hebrew cards from {result['total_cards']} total")
 
-            # Show cache info
-            info = cache.get_cache_info(deck_name)
-            if info:
-                console.print(f"[dim]Cache location: cache/{deck_name.replace(' ', '_')}_cache.pkl[/dim]")
-        else:
-            console.print(f"[red]Failed to cache deck: {result.get('error', 'Unknown error')}[/red]")
-    else:
-        console.print(f"[yellow]Cache is still valid, use --force to refresh[/yellow]")
+        # Show cache info
         info = cache.get_cache_info(deck_name)
         if info:
-            console.print(f"[dim]Cache age: {info['age_hours']:.1f} hours, {info['hebrew_cards']} Hebrew cards[/dim]")
+            console.print(f"[dim]Cache location: cache/{deck_name.replace(' ', '_')}_cache.sqlite[/dim]")
+    else:
+        console.print(f"[red]Failed to cache deck: {result.get('error', 'Unknown error')}[/red]")
 
 @app.command()
 def cache_status():
@@ -318,7 +368,7 @@ def cache_status():
         console.print(f"  Hebrew cards: {deck_info['hebrew_cards']}")
         console.print(f"  Cache age: {deck_info['age_hours']:.1f} hours")
         console.print(f"  Cached: {deck_info['cached_at']}")
-        console.print("[dim]  Cache never expires - use 'clear-cache' or 'cache-deck --force' to refresh[/dim]")
+        console.print("[dim]  Cache never expires - run 'cache-deck' to pull edited notes or 'cache-deck --force' to re-download[/dim]")
 
 @app.command()
 def clear_cache(
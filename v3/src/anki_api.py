@@ -1,17 +1,86 @@
 """
 AnkiConnect API integration for direct Anki communication
 """
+import asyncio
 import os
 import requests
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from requests.adapters import HTTPAdapter
 from rich.console import Console
+from urllib3.util.retry import Retry
 
 console = Console()
 
+DEFAULT_ANKI_URL = "http://localhost:8765"
+
+# Client settings, overridden from the anki config section by configure_anki_client
+_client_settings = {
+    "connect_url": None,
+    "request_timeout": 10,  # Seconds to wait for a response
+    "request_retries": 3,  # Reconnect attempts when AnkiConnect refuses the connection
+    "retry_backoff": 0.5,  # Seconds, doubled after each retry
+    "pool_size": 8,  # Kept-alive connections (more than one for threaded callers)
+    "max_concurrency": 4,  # Requests an AsyncAnkiClient keeps in flight
+    "media_upload_workers": 8  # Media uploads in flight during sync
+}
+_session: Optional[requests.Session] = None
+
+def configure_anki_client(anki_config: Dict):
+    """
+    Apply connection settings from the anki config section
+
+    Args:
+        anki_config: The anki section of config.yaml (connect_url, request_timeout, ...)
+    """
+    global _session
+    for key in _client_settings:
+        if anki_config.get(key) is not None:
+            _client_settings[key] = anki_config[key]
+    _session = None  # Rebuilt with the new settings on next use
+
+def get_client_setting(name: str):
+    """Current value of a connection setting (the default unless configure_anki_client set it)"""
+    return _client_settings[name]
+
 def _anki_url() -> str:
-    """Resolve AnkiConnect URL from env with sensible default."""
-    return os.getenv("ANKI_CONNECT_URL", "http://localhost:8765")
+    """Resolve AnkiConnect URL: ANKI_CONNECT_URL, then anki.connect_url, then the default."""
+    return os.getenv("ANKI_CONNECT_URL") or _client_settings["connect_url"] or DEFAULT_ANKI_URL
+
+def _get_session() -> requests.Session:
+    """
+    Shared keep-alive session for all AnkiConnect requests
+
+    Only connection failures are retried: a request that reached Anki may
+    already have been applied, and actions such as addNote are not idempotent.
+    """
+    global _session
+    if _session is None:
+        retries = Retry(
+            total=_client_settings["request_retries"],
+            connect=_client_settings["request_retries"],
+            read=0,
+            status=0,
+            other=0,  # Errors after the request may have been sent (e.g. a dropped connection)
+            backoff_factor=_client_settings["retry_backoff"],
+            allowed_methods=None  # Retry POST too (safe, as only unsent requests are retried)
+        )
+        # One kept-alive connection for every request that can be in flight at once
+        pool_size = max(_client_settings["pool_size"], _client_settings["max_concurrency"],
+                        _client_settings["media_upload_workers"])
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=retries)
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        _session = session
+    return _session
+
+def _post(payload: Dict) -> Dict:
+    """Send one AnkiConnect payload over the shared session and return the decoded response"""
+    response = _get_session().post(_anki_url(), json=payload, timeout=_client_settings["request_timeout"])
+    response.raise_for_status()
+    return response.json()
 
 def anki_request(action: str, params: Dict = None) -> Optional[Any]:
     """
@@ -34,10 +103,7 @@ def anki_request(action: str, params: Dict = None) -> Optional[Any]:
     }
 
     try:
-        response = requests.post(_anki_url(), json=payload, timeout=10)
-        response.raise_for_status()
-
-        result = response.json()
+        result = _post(payload)
         if result.get("error"):
             console.print(f"[red]AnkiConnect error:[/red] {result['error']}")
             return None
@@ -48,6 +114,116 @@ def anki_request(action: str, params: Dict = None) -> Optional[Any]:
         console.print(f"[red]Failed to connect to AnkiConnect:[/red] {e}")
         return None
 
+class AnkiFuture:
+    """Result of one action queued in an AnkiBatch, available once the batch is sent"""
+
+    def __init__(self, action: str):
+        self.action = action
+        self.error: Optional[str] = None
+        self._result = None
+        self._done = False
+
+    def _set(self, result: Any, error: Optional[str]):
+        self._result = result
+        self.error = error
+        self._done = True
+
+    def done(self) -> bool:
+        return self._done
+
+    def succeeded(self) -> bool:
+        """Whether the action ran without error (its result may still be null)"""
+        return self._done and self.error is None
+
+    def result(self) -> Optional[Any]:
+        """Action result, or None if it failed"""
+        if not self._done:
+            raise RuntimeError(f"'{self.action}' is queued in a batch that has not been sent")
+        return self._result
+
+
+class AnkiBatch:
+    """Collects independent actions and sends them as a single AnkiConnect multi request"""
+
+    def __init__(self):
+        self._queued: List[Tuple[Dict, AnkiFuture]] = []
+
+    def request(self, action: str, params: Dict = None) -> AnkiFuture:
+        """
+        Queue an action
+
+        Args:
+            action: AnkiConnect action name
+            params: Parameters for the action
+
+        Returns:
+            Future holding the action's result after send()
+        """
+        future = AnkiFuture(action)
+        self._queued.append(({"action": action, "version": 6, "params": params or {}}, future))
+        return future
+
+    def send(self) -> bool:
+        """
+        Send all queued actions in one request
+
+        Returns:
+            True if every action succeeded
+        """
+        queued, self._queued = self._queued, []
+        if not queued:
+            return True
+
+        results = anki_request("multi", {"actions": [action for action, _ in queued]})
+        if results is None:
+            for _, future in queued:
+                future._set(None, "multi request failed")
+            return False
+
+        # Versioned actions each answer with their own result/error envelope
+        for (_, future), response in zip(queued, results):
+            error = response.get("error")
+            if error:
+                console.print(f"[red]AnkiConnect error ({future.action}):[/red] {error}")
+            future._set(None if error else response.get("result"), error)
+
+        return all(future.succeeded() for _, future in queued)
+
+
+@contextmanager
+def anki_batch() -> Iterator[AnkiBatch]:
+    """
+    Batch independent AnkiConnect actions into one multi request
+
+    Actions queued with batch.request() are sent when the block exits;
+    read their futures after it.
+    """
+    batch = AnkiBatch()
+    yield batch
+    batch.send()
+
+class AsyncAnkiClient:
+    """
+    Asyncio facade over the blocking AnkiConnect helpers
+
+    Calls run on worker threads sharing the pooled session, with at most
+    max_concurrency in flight, so independent requests overlap instead of
+    waiting on each other. Create one client per event loop.
+    """
+
+    def __init__(self, max_concurrency: Optional[int] = None):
+        self.max_concurrency = max_concurrency or _client_settings["max_concurrency"]
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+    async def run(self, func: Callable, *args, **kwargs) -> Any:
+        """Run a blocking AnkiConnect call (anki_request, store_media_file, ...) on a worker thread"""
+        async with self._semaphore:
+            return await asyncio.to_thread(func, *args, **kwargs)
+
+    async def request(self, action: str, params: Dict = None) -> Optional[Any]:
+        """Async anki_request"""
+        return await self.run(anki_request, action, params)
+
 def check_anki_connection() -> bool:
     """Check if AnkiConnect is available"""
     result = anki_request("version")
@@ -63,21 +239,22 @@ def get_deck_info(deck_name: str) -> Optional[Dict]:
     Returns:
         Deck info dictionary or None if not found
     """
+    # Check the deck and compute counts via findCards queries in one request
+    with anki_batch() as batch:
+        deck_names = batch.request("deckNames")
+        total_cards = batch.request("findCards", {"query": f"deck:\"{deck_name}\""})
+        new_cards = batch.request("findCards", {"query": f"deck:\"{deck_name}\" is:new"})
+        review_cards = batch.request("findCards", {"query": f"deck:\"{deck_name}\" is:review"})
+
     # Verify deck exists
-    deck_names = anki_request("deckNames")
-    if not deck_names or deck_name not in deck_names:
+    if not deck_names.result() or deck_name not in deck_names.result():
         return None
 
-    # Compute counts via findCards queries
-    total_cards = anki_request("findCards", {"query": f"deck:\"{deck_name}\""}) or []
-    new_cards = anki_request("findCards", {"query": f"deck:\"{deck_name}\" is:new"}) or []
-    review_cards = anki_request("findCards", {"query": f"deck:\"{deck_name}\" is:review"}) or []
-
     return {
         "name": deck_name,
-        "card_count": len(total_cards),
-        "new_count": len(new_cards),
-        "review_count": len(review_cards),
+        "card_count": len(total_cards.result() or []),
+        "new_count": len(new_cards.result() or []),
+        "review_count": len(review_cards.result() or []),
     }
 
 
@@ -92,8 +269,6 @@ def add_tags_to_notes(note_ids: List[int], tags: List[str]) -> bool:
     Returns:
         True if successful
     """
-    import requests
-
     # Make request directly to properly handle null vs error
     payload = {
         "action": "addTags",
@@ -105,10 +280,7 @@ def add_tags_to_notes(note_ids: List[int], tags: List[str]) -> bool:
     }
     
     try:
-        response = requests.post(_anki_url(), json=payload, timeout=10)
-        response.raise_for_status()
-
-        result = response.json()
+        result = _post(payload)
         # Check for AnkiConnect errors
         if result.get("error"):
             console.print(f"[red]AnkiConnect error:[/red] {result['error']}")
@@ -132,16 +304,16 @@ def create_deck(deck_name: str) -> bool:
     Returns:
         True if successful or deck already exists
     """
-    # Check if deck already exists
-    deck_names = anki_request("deckNames")
-    if deck_names and deck_name in deck_names:
+    # createDeck leaves an existing deck alone, so check and create in one request
+    with anki_batch() as batch:
+        deck_names = batch.request("deckNames")
+        result = batch.request("createDeck", {"deck": deck_name})
+
+    if deck_names.result() and deck_name in deck_names.result():
         console.print(f"[yellow]Deck '{deck_name}' already exists[/yellow]")
         return True
 
-    # Create the deck
-    result = anki_request("createDeck", {"deck": deck_name})
-
-    if result is not None:
+    if result.result() is not None:
         console.print(f"[green]✓[/green] Created deck: {deck_name}")
         return True
     else:
@@ -159,19 +331,42 @@ def add_tags_to_cards(card_ids: List[int], tags: List[str]) -> bool:
     Returns:
         True if successful
     """
-    if not card_ids:
-        return True
+    results = add_tags_to_many_cards({card_id: tags for card_id in card_ids})
+    return all(results.values())
+
+def add_tags_to_many_cards(card_tags: Dict[int, List[str]]) -> Dict[int, bool]:
+    """
+    Add a tag list per card with one cardsInfo request and one batched addTags request
+
+    Args:
+        card_tags: Card ID -> tags to add to its note
+
+    Returns:
+        Card ID -> True if its note was tagged
+    """
+    if not card_tags:
+        return {}
 
     # Get card info to find note IDs
-    cards_info = anki_request("cardsInfo", {"cards": card_ids})
+    cards_info = anki_request("cardsInfo", {"cards": list(card_tags)})
     if not cards_info:
-        return False
+        return {card_id: False for card_id in card_tags}
 
-    # Extract unique note IDs
-    note_ids = list(set(card_info["note"] for card_info in cards_info))
+    # Group unique note IDs by the tags they receive
+    note_ids: Dict[Tuple[str, ...], set] = {}
+    for card_info in cards_info:
+        card_id = card_info.get("cardId")
+        if card_id in card_tags:
+            note_ids.setdefault(tuple(card_tags[card_id]), set()).add(card_info["note"])
 
-    # Add tags to notes
-    return add_tags_to_notes(note_ids, tags)
+    # Add tags to notes, one addTags action per distinct tag list
+    with anki_batch() as batch:
+        tagged = {tags: batch.request("addTags", {"notes": sorted(notes), "tags": " ".join(tags)})
+                  for tags, notes in note_ids.items()}
+
+    found = {card_info.get("cardId") for card_info in cards_info}
+    return {card_id: card_id in found and tagged[tuple(tags)].succeeded()
+            for card_id, tags in card_tags.items()}
 
 def get_existing_assimil_media() -> set:
     """
@@ -210,6 +405,34 @@ def create_note(deck_name: str, model_name: str, fields: Dict[str, str],
     result = anki_request("addNote", {"note": note_data})
     return result
 
+def create_notes(notes: List[Dict]) -> Optional[List[Optional[int]]]:
+    """
+    Create several notes in one addNotes request
+
+    Args:
+        notes: Note dictionaries (deckName, modelName, fields, tags)
+
+    Returns:
+        Note ID per note (None for notes that failed), or None if the request failed
+    """
+    if not notes:
+        return []
+    return anki_request("addNotes", {"notes": notes})
+
+def can_add_notes(notes: List[Dict]) -> Optional[List[bool]]:
+    """
+    Check which notes could be added (not empty and not duplicates) with canAddNotes
+
+    Args:
+        notes: Note dictionaries (deckName, modelName, fields, tags)
+
+    Returns:
+        One flag per note, or None if the request failed
+    """
+    if not notes:
+        return []
+    return anki_request("canAddNotes", {"notes": notes})
+
 
 def store_media_file(filename: str, file_path: Path, delete_existing: bool = True) -> Optional[str]:
     """
@@ -240,3 +463,54 @@ def store_media_file(filename: str, file_path: Path, delete_existing: bool = Tru
     except Exception as e:
         console.print(f"[red]Error storing media file {filename}: {e}[/red]")
         return None
+
+
+if __name__ == "__main__":
+    # Per-request latency against a local stub AnkiConnect server: new connection per call versus the pooled session
+    import json
+    import statistics
+    import threading
+    import time
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class StubAnkiConnect(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # Keep connections alive like AnkiConnect does
+        disable_nagle_algorithm = True  # Headers and body are separate writes; don't stall the body on a kept-alive socket
+
+        def do_POST(self):
+            request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            body = json.dumps({"result": 6 if request["action"] == "version" else [], "error": None}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubAnkiConnect)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}"
+    configure_anki_client({"connect_url": url})
+    payload = {"action": "version", "version": 6, "params": {}}
+    count = 2000
+
+    def unpooled():
+        requests.post(url, json=payload, timeout=10).json()
+
+    def pooled():
+        _post(payload)
+
+    for name, send in (("requests.post per call", unpooled), ("pooled session", pooled)):
+        send()  # Warm up
+        latencies = []
+        for _ in range(count):
+            start = time.perf_counter()
+            send()
+            latencies.append(time.perf_counter() - start)
+        latencies.sort()
+        print(f"{name}: mean {statistics.mean(latencies) * 1e6:.0f} us, "
+              f"p50 {latencies[count // 2] * 1e6:.0f} us, p99 {latencies[int(count * 0.99)] * 1e6:.0f} us")
+
+    server.shutdown()
@@ -2,26 +2,20 @@
 Anki card matching system for Hebrew words using fuzzy matching
 """
 
+import os
 import re
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List, Tuple, Optional, Set
 from dataclasses import dataclass
 from Levenshtein import distance as levenshtein_distance
 
 from src.anki_api import anki_request
-from src.tokenizer import normalize_hebrew_word
-from src.deck_cache import DeckCache
-
-
-@dataclass
-class AnkiCard:
-    """Represents an Anki card with relevant fields"""
-    card_id: int
-    note_id: int
-    hebrew: str
-    english: str
-    normalized_hebrew: str
-    tags: List[str]
-    fields: Dict[str, str]  # All fields for reference
+from src.tokenizer import normalize_hebrew_word, decliticize_variants
+from src.card_store import AnkiCard, CardStore
+from src.deck_cache import DeckCache, build_inflection_index, build_root_index
+from src.match_index import (BKTree, DeletionIndex, KeyMatrix, RootIndex, TopK,
+                             letter_mask, letter_mask_lower_bound)
 
 
 @dataclass
@@ -31,20 +25,67 @@ class WordMatch:
     normalized_word: str
     anki_card: AnkiCard
     similarity_score: int  # Levenshtein distance (lower = better)
-    match_type: str  # 'exact', 'normalized', 'fuzzy'
+    match_type: str  # 'exact', 'inflection', 'prefix', 'fuzzy'
 
 
 class AnkiMatcher:
     """Matches Hebrew words against Anki deck using fuzzy matching with persistent cache"""
 
-    def __init__(self, deck_name: str, similarity_threshold: int = 3, use_cache: bool = True):
+    MATCH_ENGINES = ('auto', 'bktree', 'scan', 'root', 'numpy')
+
+    # 'auto' searches a deletion index up to this threshold and the bucketed scan above it;
+    # the BK-tree prunes too little beyond radius 1 to beat the scan
+    AUTO_INDEX_MAX_THRESHOLD = 2
+
+    # Below this many fuzzy queries a process pool costs more than it saves
+    MIN_PARALLEL_QUERIES = 64
+
+    # Bump when matching semantics change so persisted match caches are discarded
+    MATCH_CACHE_FORMAT = 7
+
+    def __init__(self, deck_name: str, similarity_threshold: int = 3, use_cache: bool = True,
+                 deletion_index_depth: int = 0, match_engine: str = 'auto',
+                 match_workers: Optional[int] = None, match_cache_size: int = 10000,
+                 persist_match_cache: bool = False):
+        if match_engine not in self.MATCH_ENGINES:
+            raise ValueError(f"Unknown match engine '{match_engine}', expected one of {self.MATCH_ENGINES}")
+
         self.deck_name = deck_name
         self.similarity_threshold = similarity_threshold
         self.use_cache = use_cache
-        self.cards: List[AnkiCard] = []
+        self.deletion_index_depth = deletion_index_depth  # 0 disables the deletion index
+        self.match_engine = match_engine
+
+        if match_engine == 'auto':
+            self.match_engine = 'scan'
+            if not deletion_index_depth and similarity_threshold <= self.AUTO_INDEX_MAX_THRESHOLD:
+                self.deletion_index_depth = similarity_threshold
+        self.match_workers = match_workers or os.cpu_count() or 1  # Processes for find_matches_batch
+        self.cards = CardStore()  # Columnar; iterating yields AnkiCard views
         self.hebrew_lookup: Dict[str, List[AnkiCard]] = {}  # Normalized Hebrew -> Cards
+        self.inflection_lookup: Dict[str, List[AnkiCard]] = {}  # Normalized inflected form -> Cards
+        self.root_keys: Dict[str, List[str]] = {}  # Shoresh letters -> Normalized keys of its cards
+        self.bk_tree: Optional[BKTree] = None  # Metric index over hebrew_lookup keys
+        self.deletion_index: Optional[DeletionIndex] = None  # Used when threshold <= depth
+        self.root_index: Optional[RootIndex] = None  # Candidate narrowing for the root engine
+        self.key_matrix: Optional[KeyMatrix] = None  # Code-point matrix for the numpy engine
+        self.length_buckets: Dict[int, List[Tuple[str, int]]] = {}  # Length -> (key, letter mask)
+        self.loaded_from_cache = False
+        self.deck_version: Optional[str] = None  # Snapshot time of the cached deck
         self.cache = DeckCache() if use_cache else None
 
+        # LRU of finished match lists: (normalized, threshold, engine, deck_version)
+        # -> (max_candidates computed for, [(card_id, score, match_type)])
+        self.match_cache: OrderedDict = OrderedDict()
+        self.match_cache_size = match_cache_size
+        self.persist_match_cache = persist_match_cache
+        self._cards_by_id: Optional[Dict[int, AnkiCard]] = None
+
+        # Fuzzy search work counters (candidates = distinct keys the engine could have scored)
+        self.match_stats = {'fuzzy_lookups': 0, 'candidates': 0, 'distance_calls': 0,
+                            'cache_hits': 0, 'cache_misses': 0,
+                            'inflection_resolved': 0, 'prefix_resolved': 0, 'root_fallbacks': 0}
+
     def load_deck_cards(self) -> bool:
         """Load all cards from the target deck (cached or live)"""
         if self.use_cache and self.cache:
@@ -57,35 +98,25 @@ class AnkiMatcher:
         print(f"Loading cards from cache: {self.deck_name}")
 
         # Get cached deck data (never expires, manual refresh only)
-        cached_cards = self.cache.get_cached_deck(self.deck_name, max_age_hours=None, auto_refresh=False)
+        deck_table = self.cache.get_cached_deck(self.deck_name, max_age_hours=None, auto_refresh=False)
 
-        if not cached_cards:
+        if not deck_table or not len(deck_table['store']):
             print("Failed to load from cache, falling back to AnkiConnect")
             return self._load_from_anki_connect()
 
-        # Convert cached data to AnkiCard objects
-        self.cards = []
-        self.hebrew_lookup = {}
-
-        for card_data in cached_cards:
-            anki_card = AnkiCard(
-                card_id=card_data['card_id'],
-                note_id=card_data['note_id'],
-                hebrew=card_data['hebrew'],
-                english=card_data['english'],
-                normalized_hebrew=card_data['normalized_hebrew'],
-                tags=card_data['tags'],
-                fields=card_data['fields']
-            )
-
-            self.cards.append(anki_card)
+        # Cards are views over the cached columns, so nothing is copied per card
+        self.cards = deck_table['store']
+        self.hebrew_lookup = self.cards.group_by_key()
 
-            # Build lookup table for fast matching
-            normalized = card_data['normalized_hebrew']
-            if normalized not in self.hebrew_lookup:
-                self.hebrew_lookup[normalized] = []
-            self.hebrew_lookup[normalized].append(anki_card)
+        self._set_inflection_lookup(deck_table['inflections'])
+        self._set_root_keys(deck_table['roots'])
+        self.loaded_from_cache = True
+        cache_info = self.cache.get_cache_info(self.deck_name)
+        self.deck_version = cache_info['cached_at'] if cache_info else None
 
+        self._build_match_index()
+        if self.persist_match_cache:
+            self._load_match_cache()
         print(f"Loaded {len(self.cards)} Hebrew cards from cache")
         return True
 
@@ -113,8 +144,7 @@ class AnkiMatcher:
             print(f"Processed {min(i + batch_size, len(card_ids))}/{len(card_ids)} cards")
 
         # Process cards and build lookup tables
-        self.cards = []
-        self.hebrew_lookup = {}
+        self.cards = CardStore()
 
         for card_info in all_cards:
             hebrew_field = card_info['fields'].get('Hebrew', {}).get('value', '')
@@ -131,7 +161,7 @@ class AnkiMatcher:
             if not normalized:
                 continue
 
-            anki_card = AnkiCard(
+            self.cards.add(
                 card_id=card_info['cardId'],
                 note_id=card_info['note'],
                 hebrew=hebrew_clean,
@@ -141,16 +171,110 @@ class AnkiMatcher:
                 fields={name: data['value'] for name, data in card_info['fields'].items()}
             )
 
-            self.cards.append(anki_card)
-
-            # Build lookup table for fast matching
-            if normalized not in self.hebrew_lookup:
-                self.hebrew_lookup[normalized] = []
-            self.hebrew_lookup[normalized].append(anki_card)
-
+        self.load_card_store(self.cards)
         print(f"Loaded {len(self.cards)} Hebrew cards for matching")
         return True
 
+    def load_card_store(self, store: CardStore):
+        """
+        Match against cards already held in a CardStore
+
+        Builds the lookup tables and search index the way a live load does;
+        used for AnkiConnect loads and for offline decks in tests and benchmarks.
+
+        Args:
+            store: Fully loaded card store
+        """
+        self.cards = store
+
+        # Build lookup table for fast matching
+        self.hebrew_lookup = self.cards.group_by_key()
+
+        card_rows = [{'card_id': card.card_id, 'fields': card.fields, 'tags': card.tags} for card in self.cards]
+        self._set_inflection_lookup(build_inflection_index(card_rows))
+        self._set_root_keys(build_root_index(card_rows))
+        self._build_match_index()
+
+    def _set_inflection_lookup(self, inflection_index: Dict[str, List[int]]):
+        """Resolve the form -> card id reverse index to loaded cards"""
+        cards_by_id = {card.card_id: card for card in self.cards}
+        self.inflection_lookup = {}
+
+        for form, card_ids in inflection_index.items():
+            cards = [cards_by_id[card_id] for card_id in card_ids if card_id in cards_by_id]
+            # Forms that are themselves headwords are already exact matches
+            if cards and form not in self.hebrew_lookup:
+                self.inflection_lookup[form] = cards
+
+    def _set_root_keys(self, root_index: Dict[str, List[int]]):
+        """Resolve the root -> card id index to the distinct keys of those cards"""
+        keys_by_id = {card.card_id: card.normalized_hebrew for card in self.cards}
+        self.root_keys = {}
+
+        for root, card_ids in root_index.items():
+            keys = sorted({keys_by_id[card_id] for card_id in card_ids if card_id in keys_by_id})
+            if keys:
+                self.root_keys[root] = keys
+
+    def _build_match_index(self):
+        """Build the fuzzy search index over distinct normalized Hebrew keys"""
+        self.match_cache.clear()
+        self._cards_by_id = None
+        self.bk_tree = None
+        self.deletion_index = None
+        self.root_index = None
+        self.key_matrix = None
+        self.length_buckets = {}
+
+        if self.deletion_index_depth and self.similarity_threshold <= self.deletion_index_depth:
+            self.deletion_index = self._load_deletion_index()
+        elif self.match_engine == 'scan':
+            self._build_length_buckets()
+        elif self.match_engine == 'root':
+            # Words containing no indexed root fall back to the bucketed scan
+            self.root_index = RootIndex(self.root_keys)
+            self._build_length_buckets()
+        elif self.match_engine == 'numpy':
+            self.key_matrix = self._load_key_matrix()
+        else:
+            self.bk_tree = BKTree(self.hebrew_lookup.keys())
+
+    def _build_length_buckets(self):
+        """Bucket distinct normalized keys by length, keeping each key's letter mask"""
+        self.length_buckets = {}
+        for key in self.hebrew_lookup:
+            self.length_buckets.setdefault(len(key), []).append((key, letter_mask(key)))
+
+    def _load_deletion_index(self) -> DeletionIndex:
+        """Load the persisted deletion index for this deck snapshot, building it if needed"""
+        if self.loaded_from_cache:
+            index = self.cache.load_index(self.deck_name, 'deletion')
+            if index is not None and index.max_depth == self.deletion_index_depth:
+                print(f"Loaded deletion index from cache ({len(index.deletes)} variants)")
+                return index
+
+        print(f"Building deletion index (depth {self.deletion_index_depth})...")
+        index = DeletionIndex(self.hebrew_lookup.keys(), max_depth=self.deletion_index_depth)
+
+        if self.loaded_from_cache:
+            self.cache.save_index(self.deck_name, 'deletion', index)
+        return index
+
+    def _load_key_matrix(self) -> KeyMatrix:
+        """Load the persisted key matrix for this deck snapshot, building it if needed"""
+        if self.loaded_from_cache:
+            matrix = self.cache.load_index(self.deck_name, 'key_matrix')
+            if matrix is not None and len(matrix) == len(self.hebrew_lookup):
+                print(f"Loaded key matrix from cache ({len(matrix)} keys)")
+                return matrix
+
+        print("Building key matrix...")
+        matrix = KeyMatrix(self.hebrew_lookup.keys())
+
+        if self.loaded_from_cache:
+            self.cache.save_index(self.deck_name, 'key_matrix', matrix)
+        return matrix
+
     def _clean_field_text(self, text: str) -> str:
         """Clean HTML and formatting from Anki field text"""
         if not text:
@@ -174,6 +298,67 @@ class AnkiMatcher:
             List of WordMatch objects sorted by similarity score
         """
         normalized_word = normalize_hebrew_word(lesson_word)
+
+        cached = self._get_cached_matches(lesson_word, normalized_word, max_candidates)
+        if cached is not None:
+            return cached
+
+        matches = self._assemble_matches(lesson_word, normalized_word, max_candidates)
+        self._store_matches(normalized_word, max_candidates, matches)
+        return matches
+
+    def find_matches_batch(self, words: List[str], max_candidates: int = 3) -> List[List[WordMatch]]:
+        """
+        Find matches for many lesson words at once
+
+        Normalized queries are deduplicated across the batch and the fuzzy
+        searches are spread over a process pool; each worker receives the
+        search index once through its initializer.
+
+        Args:
+            words: Hebrew words from lessons
+            max_candidates: Maximum number of matches per word
+
+        Returns:
+            List of match lists, in the same order as words
+        """
+        normalized_words = [normalize_hebrew_word(word) for word in words]
+
+        # Only uncached words not resolved by dictionary lookups need the fuzzy
+        # phase, and exact matches only while they leave slots to fill
+        fuzzy_queries = {}
+        for normalized in normalized_words:
+            if normalized in fuzzy_queries or self._cached_hits(normalized, max_candidates) is not None:
+                continue
+            if normalized in self.hebrew_lookup:
+                if len(self.hebrew_lookup[normalized]) < max_candidates:
+                    fuzzy_queries[normalized] = max_candidates
+            elif not self._resolve_lookup(normalized)[1]:
+                fuzzy_queries[normalized] = max_candidates
+
+        fuzzy_hits = dict(zip(fuzzy_queries, self._fuzzy_hits_batch(list(fuzzy_queries.items()))))
+
+        results = []
+        for word, normalized in zip(words, normalized_words):
+            matches = self._get_cached_matches(word, normalized, max_candidates)
+            if matches is None:
+                matches = self._assemble_matches(word, normalized, max_candidates, fuzzy_hits.get(normalized))
+                self._store_matches(normalized, max_candidates, matches)
+            results.append(matches)
+
+        return results
+
+    def _assemble_matches(self, lesson_word: str, normalized_word: str, max_candidates: int,
+                          fuzzy_hits: Optional[List[Tuple[str, int]]] = None) -> List[WordMatch]:
+        """
+        Combine the lookup phases into the final candidate list
+
+        Exact matches are topped up with fuzzy candidates. A word with no exact
+        match but a listed inflected form, or a hit on a stem of at least three
+        letters after stripping attached prefixes, is resolved by those
+        dictionary hits alone and skips the fuzzy phase. Prefix hits score the
+        prefix length, so they rank below exact and inflection hits.
+        """
         matches = []
 
         # Phase 1: Exact normalized match
@@ -187,12 +372,35 @@ class AnkiMatcher:
                     match_type='exact'
                 ))
 
-        # Phase 2: Fuzzy matching if no exact matches or we want more candidates
-        if len(matches) < max_candidates:
-            fuzzy_matches = self._fuzzy_match(normalized_word, max_candidates - len(matches))
+        # Phases 2-3: Listed inflected forms, then forms with clitic prefixes removed
+        resolved = False
+        if not matches:
+            match_type, found = self._resolve_lookup(normalized_word)
+            for card, score in found:
+                matches.append(WordMatch(
+                    lesson_word=lesson_word,
+                    normalized_word=normalized_word,
+                    anki_card=card,
+                    similarity_score=score,
+                    match_type=match_type
+                ))
+            if found:
+                resolved = True
+                self.match_stats[f'{match_type}_resolved'] += 1
+
+        # Phase 4: Fuzzy matching if no exact matches or we want more candidates
+        if len(matches) < max_candidates and not resolved:
+            # An exact key comes back as its own nearest hit, so ask for
+            # max_candidates keys rather than just the free slots
+            if fuzzy_hits is None:
+                fuzzy_hits = self._fuzzy_hits(normalized_word, max_candidates)
+            fuzzy_hits = [(key, distance) for key, distance in fuzzy_hits if key != normalized_word]
+            fuzzy_matches = self._expand_hits(fuzzy_hits, max_candidates)
+            matched_ids = {m.anki_card.card_id for m in matches}
             for card, distance in fuzzy_matches:
                 # Avoid duplicates from exact matches
-                if not any(m.anki_card.card_id == card.card_id for m in matches):
+                if card.card_id not in matched_ids:
+                    matched_ids.add(card.card_id)
                     matches.append(WordMatch(
                         lesson_word=lesson_word,
                         normalized_word=normalized_word,
@@ -201,40 +409,314 @@ class AnkiMatcher:
                         match_type='fuzzy'
                     ))
 
-        # Sort by similarity score (exact matches first, then by distance)
-        matches.sort(key=lambda m: (m.similarity_score, m.anki_card.hebrew))
+        # Sort by similarity score (exact matches first, then by distance); at equal
+        # scores a dictionary hit ranks above a fuzzy one, then the order the fuzzy
+        # search selects in, so a shorter list is always a prefix of a longer one
+        matches.sort(key=lambda m: (m.similarity_score, m.match_type == 'fuzzy', *self._card_order(m.anki_card)))
         return matches[:max_candidates]
 
+    def _resolve_lookup(self, normalized_word: str) -> Tuple[Optional[str], List[Tuple[AnkiCard, int]]]:
+        """Dictionary lookups tried after a failed exact match, as (match_type, [(card, score)])"""
+        if normalized_word in self.inflection_lookup:
+            return 'inflection', [(card, 0) for card in self.inflection_lookup[normalized_word]]
+
+        prefix_matches = self._prefix_lookup(normalized_word)
+        if prefix_matches:
+            return 'prefix', prefix_matches
+
+        return None, []
+
+    def _prefix_lookup(self, normalized_word: str) -> List[Tuple[AnkiCard, int]]:
+        """Cards whose headword or inflected form equals the word minus an attached prefix"""
+        found = []
+        seen_ids = set()
+        for prefix, stem in decliticize_variants(normalized_word):
+            for lookup in (self.hebrew_lookup, self.inflection_lookup):
+                for card in lookup.get(stem, ()):
+                    if card.card_id not in seen_ids:
+                        seen_ids.add(card.card_id)
+                        found.append((card, len(prefix)))
+        return found
+
+    def _match_cache_key(self, normalized_word: str) -> Tuple:
+        """Key identifying a match list for the current threshold, engine and deck snapshot"""
+        # The root engine narrows candidates, so its results are cached apart
+        return (normalized_word, self.similarity_threshold, self.match_engine, self.deck_version)
+
+    def _cached_hits(self, normalized_word: str, max_candidates: int) -> Optional[List[Tuple]]:
+        """
+        The first max_candidates cached (card_id, score, match_type) entries for a word
+
+        Each word keeps the longest list computed for it, with the limit it was
+        computed for, so callers asking for fewer candidates (the pipeline's
+        similarity_candidates, the CSV export's max_candidates_per_word) share
+        one entry. A list shorter than its limit holds every candidate.
+        """
+        entry = self.match_cache.get(self._match_cache_key(normalized_word))
+        if entry is None:
+            return None
+
+        limit, hits = entry
+        if limit < max_candidates and len(hits) >= limit:
+            return None  # Computed for fewer candidates than asked for
+        return hits[:max_candidates]
+
+    def _get_cached_matches(self, lesson_word: str, normalized_word: str,
+                            max_candidates: int) -> Optional[List[WordMatch]]:
+        """Rebuild a previously computed match list for this word, if cached"""
+        hits = self._cached_hits(normalized_word, max_candidates)
+        if hits is None:
+            self.match_stats['cache_misses'] += 1
+            return None
+
+        if self._cards_by_id is None:
+            self._cards_by_id = {card.card_id: card for card in self.cards}
+
+        self.match_cache.move_to_end(self._match_cache_key(normalized_word))
+        self.match_stats['cache_hits'] += 1
+        return [
+            WordMatch(
+                lesson_word=lesson_word,
+                normalized_word=normalized_word,
+                anki_card=self._cards_by_id[card_id],
+                similarity_score=score,
+                match_type=match_type
+            )
+            for card_id, score, match_type in hits
+        ]
+
+    def _store_matches(self, normalized_word: str, max_candidates: int, matches: List[WordMatch]):
+        """Remember a match list, evicting the least recently used entries"""
+        key = self._match_cache_key(normalized_word)
+        self.match_cache[key] = (max_candidates, [(m.anki_card.card_id, m.similarity_score, m.match_type)
+                                                  for m in matches])
+        self.match_cache.move_to_end(key)
+
+        while len(self.match_cache) > self.match_cache_size:
+            self.match_cache.popitem(last=False)
+
+    def _load_match_cache(self):
+        """Restore match lists saved by a previous run over the same deck snapshot"""
+        stored = self.cache.load_index(self.deck_name, 'match_cache')
+        if not stored or stored.get('format') != self.MATCH_CACHE_FORMAT:
+            return
+
+        known_ids = set(self.cards.card_ids)
+        for key, (limit, hits) in stored['entries']:
+            if all(card_id in known_ids for card_id, _, _ in hits):
+                self.match_cache[tuple(key)] = (limit, hits)
+
+        print(f"Loaded {len(self.match_cache)} cached match results")
+
+    def save_match_cache(self) -> bool:
+        """Persist the match cache next to the deck cache (only for cached decks)"""
+        if not self.persist_match_cache or not self.loaded_from_cache:
+            return False
+
+        stored = {'format': self.MATCH_CACHE_FORMAT, 'entries': list(self.match_cache.items())}
+        return self.cache.save_index(self.deck_name, 'match_cache', stored)
+
     def _fuzzy_match(self, normalized_word: str, max_results: int) -> List[Tuple[AnkiCard, int]]:
         """Find fuzzy matches using Levenshtein distance"""
-        candidates = []
+        return self._expand_hits(self._fuzzy_hits(normalized_word, max_results), max_results)
 
-        for card in self.cards:
-            distance = levenshtein_distance(normalized_word, card.normalized_hebrew)
+    def _fuzzy_hits(self, normalized_word: str, limit: Optional[int] = None) -> List[Tuple[str, int]]:
+        """
+        Find distinct keys within threshold, sorted by distance then key
+
+        Every key expands to at least one card, so limit keys are enough to
+        fill limit candidate slots; engines stop widening once they have them.
+        """
+        self.match_stats['fuzzy_lookups'] += 1
+
+        # Each distinct key is scored once, then expanded to its cards
+        if (self.deletion_index is not None
+                and self.similarity_threshold <= self.deletion_index.max_depth):
+            return self._search_index(self.deletion_index, normalized_word, limit)
+        elif self.match_engine == 'scan':
+            if not self.length_buckets:
+                self._build_length_buckets()
+            return self._scan_length_buckets(normalized_word, limit)
+        elif self.match_engine == 'root':
+            return self._search_roots(normalized_word, limit)
+        elif self.match_engine == 'numpy':
+            if self.key_matrix is None:
+                self.key_matrix = KeyMatrix(self.hebrew_lookup.keys())
+            return self._search_index(self.key_matrix, normalized_word, limit)
+        else:
+            if self.bk_tree is None:
+                self.bk_tree = BKTree(self.hebrew_lookup.keys())
+            return self._search_index(self.bk_tree, normalized_word, limit)
+
+    @staticmethod
+    def _card_order(card: AnkiCard) -> Tuple[str, str, int]:
+        """Tie-break between equally scored cards: key, then Hebrew (homographs), then id"""
+        return card.normalized_hebrew, card.hebrew, card.card_id
 
-            # Only consider matches within threshold
-            if distance <= self.similarity_threshold:
+    def _expand_hits(self, hits: List[Tuple[str, int]], max_results: int) -> List[Tuple[AnkiCard, int]]:
+        """Expand sorted key hits to their cards, keeping the top candidates"""
+        candidates = []
+        for key, distance in hits:
+            # Cards of one key are cut in final sort order, not deck order
+            for card in sorted(self.hebrew_lookup[key], key=self._card_order):
                 candidates.append((card, distance))
+            if len(candidates) >= max_results:
+                break
 
-        # Sort by distance and return top candidates
-        candidates.sort(key=lambda x: x[1])
         return candidates[:max_results]
 
+    def _fuzzy_hits_batch(self, queries: List[Tuple[str, Optional[int]]]) -> List[List[Tuple[str, int]]]:
+        """Run fuzzy key searches for many (word, limit) queries, in a process pool when worthwhile"""
+        workers = min(self.match_workers, len(queries))
+        if workers <= 1 or len(queries) < self.MIN_PARALLEL_QUERIES:
+            return [self._fuzzy_hits(word, limit) for word, limit in queries]
+
+        # Several chunks per worker keeps the pool balanced without per-word IPC
+        chunk_size = -(-len(queries) // (workers * 4))
+        chunks = [queries[i:i + chunk_size] for i in range(0, len(queries), chunk_size)]
+
+        print(f"Matching {len(queries)} distinct words with {workers} worker processes...")
+        results = []
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_match_worker,
+                                 initargs=(self._worker_payload(),)) as executor:
+            for chunk_hits, chunk_stats in executor.map(_match_worker_chunk, chunks):
+                results.extend(chunk_hits)
+                for name, value in chunk_stats.items():
+                    self.match_stats[name] += value
+
+        return results
+
+    def _worker_payload(self) -> Dict:
+        """Search state shipped once to each worker process"""
+        if self.match_engine == 'bktree' and self.deletion_index is None and self.bk_tree is None:
+            self.bk_tree = BKTree(self.hebrew_lookup.keys())
+
+        return {
+            'keys': list(self.hebrew_lookup),
+            'similarity_threshold': self.similarity_threshold,
+            'match_engine': self.match_engine,
+            'bk_tree': self.bk_tree,
+            'deletion_index': self.deletion_index,
+            'root_index': self.root_index,
+            'key_matrix': self.key_matrix,
+        }
+
+    def _search_index(self, index, normalized_word: str, limit: Optional[int]) -> List[Tuple[str, int]]:
+        """Query a key index for keys within threshold"""
+        calls_before = index.distance_calls
+        hits = index.search(normalized_word, self.similarity_threshold, limit)
+
+        self.match_stats['candidates'] += len(self.hebrew_lookup)
+        self.match_stats['distance_calls'] += index.distance_calls - calls_before
+        return hits
+
+    def _search_roots(self, normalized_word: str, limit: Optional[int]) -> List[Tuple[str, int]]:
+        """Score only keys whose root occurs in the word, scanning all keys when none does"""
+        if self.root_index is None:
+            self.root_index = RootIndex(self.root_keys)
+
+        calls_before = self.root_index.distance_calls
+        hits = self.root_index.search(normalized_word, self.similarity_threshold, limit)
+
+        if hits is None:
+            self.match_stats['root_fallbacks'] += 1
+            if not self.length_buckets:
+                self._build_length_buckets()
+            return self._scan_length_buckets(normalized_word, limit)
+
+        self.match_stats['candidates'] += len(self.hebrew_lookup)
+        self.match_stats['distance_calls'] += self.root_index.distance_calls - calls_before
+        return hits
+
+    def _scan_length_buckets(self, normalized_word: str, limit: Optional[int]) -> List[Tuple[str, int]]:
+        """Score only keys whose length and letters can lie within threshold"""
+        threshold = self.similarity_threshold
+        query_length = len(normalized_word)
+        query_mask = letter_mask(normalized_word)
+        top = TopK(limit, threshold)
+        distance_calls = 0
+
+        # Distance is at least the length difference, so skip out-of-range
+        # buckets; nearest lengths first fill the selection and tighten the cut-off
+        lengths = range(max(0, query_length - threshold), query_length + threshold + 1)
+        for length in sorted(lengths, key=lambda n: abs(n - query_length)):
+            if abs(length - query_length) > top.radius:
+                continue
+
+            for key, mask in self.length_buckets.get(length, ()):
+                if letter_mask_lower_bound(query_mask, mask) > top.radius:
+                    continue
+
+                distance_calls += 1
+                top.offer(key, levenshtein_distance(normalized_word, key, score_cutoff=top.radius))
+
+        self.match_stats['candidates'] += len(self.hebrew_lookup)
+        self.match_stats['distance_calls'] += distance_calls
+        return top.results()
+
     def get_deck_stats(self) -> Dict[str, int]:
         """Get statistics about loaded deck"""
+        candidates = self.match_stats['candidates']
+        distance_calls = self.match_stats['distance_calls']
+
         return {
             'total_cards': len(self.cards),
             'unique_words': len(self.hebrew_lookup),
+            'match_engine': self.match_engine,
+            'fuzzy_lookups': self.match_stats['fuzzy_lookups'],
+            'fuzzy_distance_calls': distance_calls,
+            'pruning_ratio': round(1 - distance_calls / candidates, 3) if candidates else 0.0,
+            'match_cache_hits': self.match_stats['cache_hits'],
+            'match_cache_misses': self.match_stats['cache_misses'],
+            'inflection_forms': len(self.inflection_lookup),
+            'inflection_resolved': self.match_stats['inflection_resolved'],
+            'prefix_resolved': self.match_stats['prefix_resolved'],
+            'roots': len(self.root_keys),
+            'root_fallbacks': self.match_stats['root_fallbacks'],
             'deck_name': self.deck_name
         }
 
 
+# Matcher rebuilt in each worker process of find_matches_batch
+_worker_matcher: Optional[AnkiMatcher] = None
+
+
+def _init_match_worker(payload: Dict):
+    """Process pool initializer: rebuild a key-only matcher from the shipped index"""
+    global _worker_matcher
+
+    matcher = AnkiMatcher('worker', payload['similarity_threshold'], use_cache=False,
+                          match_engine=payload['match_engine'])
+    matcher.hebrew_lookup = dict.fromkeys(payload['keys'], ())
+    matcher.bk_tree = payload['bk_tree']
+    matcher.deletion_index = payload['deletion_index']
+    matcher.root_index = payload['root_index']
+    matcher.key_matrix = payload['key_matrix']
+    _worker_matcher = matcher
+
+
+def _match_worker_chunk(queries: List[Tuple[str, Optional[int]]]) -> Tuple[List[List[Tuple[str, int]]], Dict[str, int]]:
+    """Search one chunk of (word, limit) queries in a worker, returning hits and work counters"""
+    matcher = _worker_matcher
+    matcher.match_stats = {name: 0 for name in matcher.match_stats}
+    hits = [matcher._fuzzy_hits(word, limit) for word, limit in queries]
+    return hits, matcher.match_stats
+
+
 def create_matcher_from_config(config: dict, use_cache: bool = True) -> AnkiMatcher:
     """Create AnkiMatcher from configuration"""
     deck_name = config['anki']['hebrew_deck']
     threshold = config['processing'].get('word_match_threshold', 3)
-
-    matcher = AnkiMatcher(deck_name, threshold, use_cache=use_cache)
+    deletion_index_depth = config['processing'].get('deletion_index_depth', 0)
+    match_engine = config['processing'].get('match_engine', 'auto')
+    match_workers = config['processing'].get('match_workers')
+    match_cache_size = config['processing'].get('match_cache_size', 10000)
+    persist_match_cache = config['processing'].get('persist_match_cache', False)
+
+    matcher = AnkiMatcher(deck_name, threshold, use_cache=use_cache,
+                          deletion_index_depth=deletion_index_depth, match_engine=match_engine,
+                          match_workers=match_workers, match_cache_size=match_cache_size,
+                          persist_match_cache=persist_match_cache)
     matcher.load_deck_cards()
     return matcher
 
@@ -5,11 +5,11 @@ Handles scanning MP3 files and incremental extraction
 from pathlib import Path
 from typing import List, Dict, Tuple, Optional, Set
 from rich.console import Console
-from mutagen.mp3 import MP3
-from mutagen.easyid3 import EasyID3
 import shutil
 import csv
 
+from .mp3_metadata import Mp3MetadataCache, Mp3Tags, read_mp3_tags
+
 console = Console()
 
 def load_existing_translations(csv_path: Path) -> Set[str]:
@@ -81,15 +81,20 @@ def scan_mp3_files(lesson_dir: Path, skip_files: List[str] = None) -> List[Path]
 
     return filtered_files
 
-def extract_mp3_metadata(mp3_file: Path) -> Optional[Dict[str, str]]:
+def extract_mp3_metadata(mp3_file: Path, tags: Optional[Mp3Tags] = None) -> Optional[Dict[str, str]]:
     """
     Extract metadata from an MP3 file
+
+    Args:
+        mp3_file: MP3 file
+        tags: Text frames already read for the file (read from the file if None)
     """
     try:
-        audio = MP3(str(mp3_file), ID3=EasyID3)
+        if tags is None:
+            tags = read_mp3_tags(mp3_file)
 
-        title = audio.get('title', [''])[0] if 'title' in audio else ''
-        album = audio.get('album', [''])[0] if 'album' in audio else ''
+        title = tags.get('TIT2', [''])[0]
+        album = tags.get('TALB', [''])[0]
 
         if not title or not album:
             console.print(f"[yellow]Warning:[/yellow] Missing metadata in {mp3_file.name}")
@@ -167,12 +172,19 @@ def extract_audio_incremental(config: Dict) -> List[Dict]:
         for mp3_file in mp3_files:
             all_files.append((lesson_dir, mp3_file))
 
+    # Read tags of new or changed files only
+    metadata_cache = Mp3MetadataCache(data_dir / "mp3_metadata_cache.json")
+    tags_by_file = metadata_cache.get_tags(mp3_file for _, mp3_file in all_files)
+    metadata_cache.save()
+    console.print(f"[dim]MP3 tags: {metadata_cache.hits} cached, {metadata_cache.reads} read[/dim]")
+
     # Process files and filter out existing translations
     new_lessons = []
     skipped_count = 0
 
     for lesson_dir, mp3_file in all_files:
-        metadata = extract_mp3_metadata(mp3_file)
+        tags = tags_by_file[mp3_file]
+        metadata = extract_mp3_metadata(mp3_file, tags) if tags is not None else None
         if metadata:
             if metadata['id'] in existing_ids:
                 skipped_count += 1
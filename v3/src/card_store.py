@@ -0,0 +1,297 @@
+"""
+Columnar card storage with lightweight per-card views
+"""
+
+import sys
+from array import array
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Anki separates note fields with the unit separator, so it never occurs inside a value
+FIELD_SEPARATOR = '\x1f'
+
+# Card details as (hebrew, english, tags, fields)
+CardDetails = Tuple[str, str, List[str], Dict[str, str]]
+
+# Rows fetched together when a view of a lazily opened store reads its details,
+# so walking the views in order costs one loader call per window instead of per card
+DETAIL_PREFETCH_ROWS = 256
+
+
+class AnkiCard:
+    """Read-only view of one card row in a CardStore"""
+
+    __slots__ = ('store', 'row')
+
+    def __init__(self, store: 'CardStore', row: int):
+        self.store = store
+        self.row = row
+
+    @property
+    def card_id(self) -> int:
+        return self.store.card_ids[self.row]
+
+    @property
+    def note_id(self) -> int:
+        return self.store.note_ids[self.row]
+
+    @property
+    def hebrew(self) -> str:
+        self.store.load_row(self.row)
+        return self.store.hebrew[self.row]
+
+    @property
+    def english(self) -> str:
+        self.store.load_row(self.row)
+        return self.store.english[self.row]
+
+    @property
+    def normalized_hebrew(self) -> str:
+        return self.store.keys[self.store.key_rows[self.row]]
+
+    @property
+    def tags(self) -> List[str]:
+        self.store.load_row(self.row)
+        return list(self.store.tag_sets[self.store.tag_rows[self.row]])
+
+    @property
+    def fields(self) -> Dict[str, str]:
+        """All note fields, decoded on access"""
+        self.store.load_row(self.row)
+        return self.store.fields(self.row)
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, AnkiCard) and self.store is other.store and self.row == other.row
+
+    def __hash__(self) -> int:
+        return hash((id(self.store), self.row))
+
+    def __repr__(self) -> str:
+        return f"AnkiCard(card_id={self.card_id}, note_id={self.note_id}, hebrew={self.hebrew!r}, english={self.english!r})"
+
+
+class CardStore:
+    """
+    Deck cards as parallel columns
+
+    Normalized keys, tag sets and field layouts are stored once and referenced
+    by index; field values are kept as one joined string per card and only
+    split into a dict when a view's fields are read.
+
+    A store opened with a detail loader starts with ids and keys only; the
+    text columns of a card are fetched the first time a view reads them.
+    """
+
+    def __init__(self, detail_loader: Optional[Callable[[List[int]], Dict[int, CardDetails]]] = None):
+        self.card_ids = array('q')
+        self.note_ids = array('q')
+        self.hebrew: List[str] = []
+        self.english: List[str] = []
+        self.keys: List[str] = []  # Distinct normalized Hebrew
+        self.key_rows = array('l')  # Card -> index into keys
+        self.tag_sets: List[Tuple[str, ...]] = []  # Distinct tag tuples
+        self.tag_rows = array('l')
+        self.field_layouts: List[Tuple[str, ...]] = []  # Distinct field name orders (one per note type)
+        self.layout_rows = array('l')
+        self.field_values: List[Optional[str]] = []  # FIELD_SEPARATOR-joined values per card
+        self.detail_loader = detail_loader  # card ids -> {card_id: details}, for lazily opened stores
+        self._reset_lookups()
+
+    @classmethod
+    def lazy(cls, card_ids: Iterable[int], note_ids: Iterable[int], keys: List[str], key_rows: Iterable[int],
+             detail_loader: Callable[[List[int]], Dict[int, CardDetails]]) -> 'CardStore':
+        """Store holding only ids and keys, fetching card details through detail_loader on demand"""
+        store = cls(detail_loader)
+        store.card_ids.extend(card_ids)
+        store.note_ids.extend(note_ids)
+        store.keys = list(keys)
+        store.key_rows.extend(key_rows)
+        store._reset_lookups()
+
+        count = len(store.card_ids)
+        store.hebrew = [None] * count
+        store.english = [None] * count
+        store.tag_rows.extend([0] * count)
+        store.layout_rows.extend([0] * count)
+        store.field_values = [None] * count
+        return store
+
+    def _reset_lookups(self):
+        """Value -> index maps used while adding cards (rebuilt after unpickling)"""
+        self._key_index = {key: i for i, key in enumerate(self.keys)}
+        self._tag_index = {tags: i for i, tags in enumerate(self.tag_sets)}
+        self._layout_index = {layout: i for i, layout in enumerate(self.field_layouts)}
+        self._views: Optional[List[AnkiCard]] = None
+
+    def __getstate__(self) -> Dict:
+        state = self.__dict__.copy()
+        for name in ('_key_index', '_tag_index', '_layout_index', '_views'):
+            del state[name]
+        return state
+
+    def __setstate__(self, state: Dict):
+        self.__dict__.update(state)
+        self._reset_lookups()
+
+    def add(self, card_id: int, note_id: int, hebrew: str, english: str,
+            normalized_hebrew: str, tags: List[str], fields: Dict[str, str]) -> AnkiCard:
+        """Append a card and return its view"""
+        row = len(self.card_ids)
+        self.card_ids.append(card_id)
+        self.note_ids.append(note_id)
+        self.key_rows.append(self._intern_index(normalized_hebrew, self.keys, self._key_index))
+        self.hebrew.append(None)
+        self.english.append(None)
+        self.tag_rows.append(0)
+        self.layout_rows.append(0)
+        self.field_values.append(None)
+        self._set_details(row, hebrew, english, tags, fields)
+
+        view = AnkiCard(self, row)
+        if self._views is not None:
+            self._views.append(view)
+        return view
+
+    def _set_details(self, row: int, hebrew: str, english: str, tags: List[str], fields: Dict[str, str]):
+        """Fill the text columns of one row"""
+        self.hebrew[row] = sys.intern(hebrew)
+        self.english[row] = english
+        self.tag_rows[row] = self._intern_index(tuple(tags), self.tag_sets, self._tag_index)
+        self.layout_rows[row] = self._intern_index(tuple(fields), self.field_layouts, self._layout_index)
+        self.field_values[row] = FIELD_SEPARATOR.join(fields.values())
+
+    def load_row(self, row: int):
+        """Fetch the text columns of a row, together with the following rows not loaded yet"""
+        if self.hebrew[row] is None:
+            self.load_details(range(row, min(row + DETAIL_PREFETCH_ROWS, len(self.card_ids))))
+            if self.hebrew[row] is None:
+                # A deck refresh deleted the card after this store was opened
+                raise LookupError(f"Card {self.card_ids[row]} is no longer in the deck cache; "
+                                  f"reload the deck to match against its current cards")
+
+    def load_details(self, rows: Iterable[int]):
+        """
+        Fetch the text columns of rows not loaded yet (no-op for fully loaded stores)
+
+        Rows whose card the loader no longer returns are left unloaded.
+        """
+        missing = [row for row in rows if self.hebrew[row] is None]
+        if not missing:
+            return
+
+        details = self.detail_loader([self.card_ids[row] for row in missing])
+        for row in missing:
+            card_details = details.get(self.card_ids[row])
+            if card_details is not None:
+                self._set_details(row, *card_details)
+
+    @staticmethod
+    def _intern_index(value, values: list, index: Dict) -> int:
+        """Index of value in a distinct-value column, appending it if new"""
+        position = index.get(value)
+        if position is None:
+            position = index[value] = len(values)
+            values.append(value)
+        return position
+
+    def fields(self, row: int) -> Dict[str, str]:
+        """Decode the note fields of one card"""
+        layout = self.field_layouts[self.layout_rows[row]]
+        return dict(zip(layout, self.field_values[row].split(FIELD_SEPARATOR)))
+
+    def views(self) -> List[AnkiCard]:
+        """One shared view per card, created on first use"""
+        if self._views is None:
+            self._views = [AnkiCard(self, row) for row in range(len(self.card_ids))]
+        return self._views
+
+    def group_by_key(self) -> Dict[str, List[AnkiCard]]:
+        """Map each normalized key to the views of its cards"""
+        groups: List[List[AnkiCard]] = [[] for _ in self.keys]
+        for view, key_row in zip(self.views(), self.key_rows):
+            groups[key_row].append(view)
+        return dict(zip(self.keys, groups))
+
+    def __len__(self) -> int:
+        return len(self.card_ids)
+
+    def __iter__(self) -> Iterator[AnkiCard]:
+        return iter(self.views())
+
+    def __getitem__(self, row: int) -> AnkiCard:
+        return self.views()[row]
+
+
+def load_card_details(cards: Iterable[AnkiCard]):
+    """Fetch the details of many views up front, with one load_details call per store"""
+    rows_by_store: Dict[CardStore, List[int]] = {}
+    for card in cards:
+        rows_by_store.setdefault(card.store, []).append(card.row)
+
+    for store, rows in rows_by_store.items():
+        store.load_details(rows)
+
+
+if __name__ == "__main__":
+    # Compare loading a pickled deck into per-card objects versus the columnar store
+    import gc
+    import pickle
+    import random
+    import time
+    import tracemalloc
+    from dataclasses import dataclass
+
+    @dataclass
+    class RowCard:
+        """Per-card layout the store replaces: one object, fields dict and tag list per card"""
+        card_id: int
+        note_id: int
+        hebrew: str
+        english: str
+        normalized_hebrew: str
+        tags: List[str]
+        fields: Dict[str, str]
+
+    random.seed(0)
+    letters = [chr(c) for c in range(0x05d0, 0x05eb)]
+    lesson_tags = [f"assimil::lesson_{n:03d}" for n in range(1, 101)]
+
+    rows = []
+    for note_id in range(25000):
+        hebrew = "".join(random.choice(letters) for _ in range(random.randint(2, 8)))
+        fields = {'Hebrew': hebrew, 'English': f"meaning {note_id}", 'Shoresh': '',
+                  'Inflections': '', 'Audio': f"[sound:{note_id}.mp3]"}
+        tags = ['hebrew'] + random.sample(lesson_tags, random.randint(0, 2))
+        for card_id in (note_id * 2, note_id * 2 + 1):  # Forward and reverse card
+            rows.append({'card_id': card_id, 'note_id': note_id, 'hebrew': hebrew,
+                         'english': fields['English'], 'normalized_hebrew': hebrew,
+                         'tags': list(tags), 'fields': dict(fields)})
+
+    store = CardStore()
+    for row in rows:
+        store.add(row['card_id'], row['note_id'], row['hebrew'], row['english'],
+                  row['normalized_hebrew'], row['tags'], row['fields'])
+
+    row_blob = pickle.dumps(rows)
+    store_blob = pickle.dumps(store)
+    print(f"{len(rows)} cards: row pickle {len(row_blob) / 1e6:.1f} MB, store pickle {len(store_blob) / 1e6:.1f} MB")
+
+    def load_rows() -> List[RowCard]:
+        return [RowCard(**row) for row in pickle.loads(row_blob)]
+
+    def load_store() -> CardStore:
+        loaded = pickle.loads(store_blob)
+        loaded.group_by_key()
+        return loaded
+
+    for name, load in (("per-card objects", load_rows), ("columnar store", load_store)):
+        gc.collect()
+        start = time.perf_counter()
+        load()
+        elapsed = time.perf_counter() - start
+
+        tracemalloc.start()
+        loaded = load()
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del loaded
+        print(f"{name}: load {elapsed * 1000:.0f} ms, retained {current / 1e6:.1f} MB, peak {peak / 1e6:.1f} MB")
@@ -37,31 +37,35 @@ class CSVExporter:
         Returns:
             List of MatchSuggestion objects
         """
-        suggestions = []
+        from .card_store import load_card_details
 
+        # Get multiple match candidates for each word
+        word_matches = []
         for lesson_num in sorted(self.pipeline.lesson_matches.keys()):
-            lesson_matches = self.pipeline.lesson_matches[lesson_num]
-
-            for lesson_match in lesson_matches:
+            for lesson_match in self.pipeline.lesson_matches[lesson_num]:
                 lesson_word = lesson_match.lesson_word
-
-                # Get multiple match candidates for this word
                 all_matches = self.pipeline.anki_matcher.find_matches(
                     lesson_word.word,
                     max_candidates=max_candidates_per_word
                 )
+                word_matches.append((lesson_num, lesson_word, all_matches))
 
-                # Generate suggestions for each match candidate
-                for match in all_matches:
-                    suggestion = MatchSuggestion(
-                        lesson=lesson_num,
-                        heb_word=lesson_word.word,
-                        match_word=match.anki_card.hebrew,
-                        match_word_def=match.anki_card.english,
-                        score=match.similarity_score,
-                        card_id=match.anki_card.card_id
-                    )
-                    suggestions.append(suggestion)
+        # Candidate details are fetched in one go rather than per card
+        load_card_details(match.anki_card for _, _, all_matches in word_matches for match in all_matches)
+
+        # Generate suggestions for each match candidate
+        suggestions = []
+        for lesson_num, lesson_word, all_matches in word_matches:
+            for match in all_matches:
+                suggestion = MatchSuggestion(
+                    lesson=lesson_num,
+                    heb_word=lesson_word.word,
+                    match_word=match.anki_card.hebrew,
+                    match_word_def=match.anki_card.english,
+                    score=match.similarity_score,
+                    card_id=match.anki_card.card_id
+                )
+                suggestions.append(suggestion)
 
         return suggestions
 
@@ -216,6 +220,9 @@ def export_word_matches(config: dict, max_lessons: Optional[int] = None,
         print(f"2. Copy/paste approved rows to 'data/assimil-words.csv'")
         print(f"3. Run 'apply-tags data/assimil-words.csv' to tag Anki cards")
 
+    # Keep match results for the next run over the same deck snapshot
+    pipeline.anki_matcher.save_match_cache()
+
     return success
 
 
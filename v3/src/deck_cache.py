@@ -2,14 +2,130 @@
 Persistent deck cache system to avoid slow AnkiConnect downloads
 """
 
+import asyncio
 import json
+import os
 import pickle
+import re
+import sqlite3
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 from datetime import datetime, timedelta
 
-from src.anki_api import anki_request
-from src.tokenizer import normalize_hebrew_word
+from src.anki_api import AsyncAnkiClient, anki_request
+from src.card_store import CardStore
+from src.tokenizer import normalize_hebrew_word, extract_hebrew_words, root_letters
+
+# On-disk format: 1.0 = pickled list of card dicts, 3.0 = SQLite database
+CACHE_VERSION = '3.0'
+
+DECK_SCHEMA = """
+CREATE TABLE meta (name TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE keys (key_id INTEGER PRIMARY KEY, key TEXT NOT NULL UNIQUE);
+CREATE TABLE cards (
+    card_id INTEGER PRIMARY KEY,
+    note_id INTEGER NOT NULL,
+    key_id INTEGER NOT NULL REFERENCES keys (key_id),
+    hebrew TEXT NOT NULL,
+    english TEXT NOT NULL,
+    tags TEXT NOT NULL,     -- Space separated, as Anki stores them
+    fields TEXT NOT NULL,   -- JSON object of note fields
+    root TEXT
+);
+CREATE TABLE inflections (form TEXT NOT NULL, card_id INTEGER NOT NULL);
+CREATE INDEX inflections_card ON inflections (card_id);
+-- Every deck card, Hebrew or not, so refreshes can tell new cards apart
+CREATE TABLE card_notes (card_id INTEGER PRIMARY KEY, note_id INTEGER NOT NULL);
+CREATE TABLE note_mods (note_id INTEGER PRIMARY KEY, mod INTEGER NOT NULL);
+"""
+
+# Cards per cardsInfo request
+DOWNLOAD_BATCH_SIZE = 500
+
+# Note field listing plural/inflected forms of the headword
+INFLECTION_FIELD = 'Inflections'
+
+# Note field holding the root letters (e.g. "שׁ־ע־ר"); tags like "ש::ע::ר" are the fallback
+SHORESH_FIELD = 'Shoresh'
+
+# Hebrew roots are biliteral to quadriliteral
+ROOT_LENGTHS = range(2, 5)
+
+
+def extract_inflection_forms(field_value: str) -> List[str]:
+    """
+    Normalized single-word forms listed in an Inflections field
+
+    Entries are separated by commas, semicolons, slashes or line breaks;
+    multi-word entries are skipped so particles never map to a headword.
+    """
+    text = re.sub(r'<[^>]+>', '\n', field_value or '')
+    forms = []
+
+    for entry in re.split(r'[,;/|\n]', text):
+        words = extract_hebrew_words(entry)
+        if len(words) != 1:
+            continue
+
+        normalized = normalize_hebrew_word(words[0])
+        if normalized and normalized not in forms:
+            forms.append(normalized)
+
+    return forms
+
+
+def build_inflection_index(cards: List[Dict]) -> Dict[str, List[int]]:
+    """Map each normalized inflected form to the ids of the cards listing it"""
+    index: Dict[str, List[int]] = {}
+
+    for card in cards:
+        for form in extract_inflection_forms(card['fields'].get(INFLECTION_FIELD, '')):
+            index.setdefault(form, []).append(card['card_id'])
+
+    return index
+
+
+def extract_shoresh(fields: Dict[str, str], tags: List[str]) -> Optional[str]:
+    """
+    Root letters of a note from its Shoresh field or a root tag
+
+    Returns:
+        Bare root letters with final forms folded (e.g. "שער"), or None
+    """
+    root = root_letters(re.sub(r'<[^>]+>', '', fields.get(SHORESH_FIELD, '')))
+    if len(root) in ROOT_LENGTHS:
+        return root
+
+    for tag in tags:
+        parts = tag.split('::')
+        # "ל::מ::ד", optionally under one parent level such as "shoresh::ל::מ::ד"
+        if not root_letters(parts[0]):
+            parts = parts[1:]
+
+        letters = [root_letters(part) for part in parts]
+        if len(parts) in ROOT_LENGTHS and all(len(part) == 1 and len(letter) == 1
+                                              for part, letter in zip(parts, letters)):
+            return ''.join(letters)
+
+    return None
+
+
+def card_root(card: Dict) -> Optional[str]:
+    """Root of a processed card (cards without a 'root' are parsed from fields and tags)"""
+    return card['root'] if 'root' in card else extract_shoresh(card['fields'], card['tags'])
+
+
+def build_root_index(cards: List[Dict]) -> Dict[str, List[int]]:
+    """Map each root to the ids of its cards"""
+    index: Dict[str, List[int]] = {}
+
+    for card in cards:
+        root = card_root(card)
+        if root:
+            index.setdefault(root, []).append(card['card_id'])
+
+    return index
 
 
 class DeckCache:
@@ -19,26 +135,37 @@ class DeckCache:
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(exist_ok=True)
 
-    def _get_cache_path(self, deck_name: str) -> Path:
-        """Get cache file path for deck"""
-        # Create safe filename from deck name
+    def _get_safe_name(self, deck_name: str) -> str:
+        """Create safe filename stem from deck name"""
         safe_name = "".join(c for c in deck_name if c.isalnum() or c in (' ', '-', '_')).rstrip()
-        safe_name = safe_name.replace(' ', '_')
-        return self.cache_dir / f"{safe_name}_cache.pkl"
+        return safe_name.replace(' ', '_')
+
+    def _get_cache_path(self, deck_name: str) -> Path:
+        """Get cache database path for deck"""
+        return self.cache_dir / f"{self._get_safe_name(deck_name)}_cache.sqlite"
+
+    def _get_legacy_cache_path(self, deck_name: str) -> Path:
+        """Get path of a pickled cache from format 1.0"""
+        return self.cache_dir / f"{self._get_safe_name(deck_name)}_cache.pkl"
 
     def _get_metadata_path(self, deck_name: str) -> Path:
         """Get metadata file path for deck"""
-        safe_name = "".join(c for c in deck_name if c.isalnum() or c in (' ', '-', '_')).rstrip()
-        safe_name = safe_name.replace(' ', '_')
-        return self.cache_dir / f"{safe_name}_meta.json"
+        return self.cache_dir / f"{self._get_safe_name(deck_name)}_meta.json"
+
+    def _get_index_path(self, deck_name: str, index_name: str) -> Path:
+        """Get file path for a derived search index stored next to the deck cache"""
+        return self.cache_dir / f"{self._get_safe_name(deck_name)}_{index_name}_index.pkl"
 
     def is_cache_valid(self, deck_name: str, max_age_hours: int = None) -> bool:
-        """Check if cached deck exists (never expires unless max_age_hours specified)"""
-        cache_path = self._get_cache_path(deck_name)
+        """Check if a current-format cached deck exists (never expires unless max_age_hours specified)"""
         meta_path = self._get_metadata_path(deck_name)
+        if not meta_path.exists():
+            return False
 
-        if not cache_path.exists() or not meta_path.exists():
+        conn = self._open_deck_db(deck_name)
+        if conn is None:
             return False
+        conn.close()
 
         # If no max_age_hours specified, cache never expires (manual management only)
         if max_age_hours is None:
@@ -69,40 +196,14 @@ class DeckCache:
                 return {'success': False, 'error': 'No cards found'}
 
             print(f"Found {len(card_ids)} cards, downloading details...")
-
-            # Get detailed card information in batches
-            batch_size = 500
-            all_cards = []
-
-            for i in range(0, len(card_ids), batch_size):
-                batch = card_ids[i:i + batch_size]
-                cards_info = anki_request('cardsInfo', {'cards': batch})
-                if cards_info:
-                    all_cards.extend(cards_info)
-                print(f"Downloaded {min(i + batch_size, len(card_ids))}/{len(card_ids)} cards")
+            all_cards = self._download_cards(card_ids)
 
             # Process and cache cards
             processed_cards = self._process_cards(all_cards)
+            card_notes = {card['cardId']: card['note'] for card in all_cards}
+            note_mods = self._note_mod_times(set(card_notes.values()))
 
-            cache_path = self._get_cache_path(deck_name)
-            meta_path = self._get_metadata_path(deck_name)
-
-            # Save processed cards
-            with open(cache_path, 'wb') as f:
-                pickle.dump(processed_cards, f)
-
-            # Save metadata
-            metadata = {
-                'deck_name': deck_name,
-                'cached_at': datetime.now().isoformat(),
-                'card_count': len(all_cards),
-                'hebrew_cards': len(processed_cards),
-                'cache_version': '1.0'
-            }
-
-            with open(meta_path, 'w') as f:
-                json.dump(metadata, f, indent=2)
-
+            self._create_deck_db(deck_name, processed_cards, card_notes, note_mods)
             print(f"✓ Cached {len(processed_cards)} Hebrew cards from {len(all_cards)} total cards")
 
             return {
@@ -115,6 +216,278 @@ class DeckCache:
             print(f"Error caching deck: {e}")
             return {'success': False, 'error': str(e)}
 
+    def refresh_deck(self, deck_name: str) -> Dict[str, any]:
+        """
+        Bring the cached deck up to date, downloading only notes edited since the last refresh
+
+        Falls back to a full download when there is no cache, it predates
+        stored note modification times, or AnkiConnect cannot report them.
+        """
+        conn = self._open_deck_db(deck_name)
+        info = self.get_cache_info(deck_name)
+        if conn is None or not info or self._get_meta(conn, 'note_mods') != 'complete':
+            if conn is not None:
+                conn.close()
+            return self.cache_deck(deck_name)
+
+        print(f"Refreshing cached deck: {deck_name}")
+
+        try:
+            card_ids = anki_request('findCards', {'query': f'deck:"{deck_name}"'})
+            if card_ids is None:
+                return {'success': False, 'error': 'Could not list deck cards'}
+
+            # edited:N counts whole days, so candidates are re-checked against stored note mod times
+            last_refresh = datetime.fromisoformat(info.get('refreshed_at', info['cached_at']))
+            days = (datetime.now() - last_refresh).days + 1
+            edited_ids = anki_request('findCards', {'query': f'deck:"{deck_name}" edited:{days}'})
+            if edited_ids is None:
+                return {'success': False, 'error': 'Could not query edited cards'}
+
+            card_notes = dict(conn.execute('SELECT card_id, note_id FROM card_notes'))
+            note_mods = dict(conn.execute('SELECT note_id, mod FROM note_mods'))
+            current_ids = set(card_ids)
+            removed_ids = card_notes.keys() - current_ids
+            fetch_ids = current_ids - card_notes.keys()  # Added to the deck since the last refresh
+
+            edited_notes = {card_notes[card_id] for card_id in edited_ids if card_id in card_notes}
+            mods = self._note_mod_times(edited_notes) if edited_notes else {}
+            if mods is None:
+                return self.cache_deck(deck_name)
+            changed_notes = {note_id for note_id, mod in mods.items() if note_mods.get(note_id) != mod}
+            fetch_ids |= {card_id for card_id in current_ids if card_notes.get(card_id) in changed_notes}
+
+            if not fetch_ids and not removed_ids:
+                hebrew_cards = self._write_metadata(deck_name, conn, self._read_metadata(deck_name))
+                print(f"✓ Cache is up to date ({hebrew_cards} Hebrew cards)")
+                return {'success': True, 'total_cards': len(card_ids), 'hebrew_cards': hebrew_cards,
+                        'updated': 0, 'removed': 0}
+
+            print(f"{len(fetch_ids)} new or edited cards, {len(removed_ids)} removed, downloading changes...")
+            fetched = self._download_cards(sorted(fetch_ids))
+
+            # Replace changed cards in place; keys and notes left without cards are dropped
+            with conn:
+                self._delete_cards(conn, removed_ids | fetch_ids)
+                self._insert_cards(conn, self._process_cards(fetched))
+                conn.executemany('INSERT INTO card_notes VALUES (?, ?)',
+                                 ((card['cardId'], card['note']) for card in fetched))
+                conn.execute('DELETE FROM keys WHERE key_id NOT IN (SELECT key_id FROM cards)')
+                conn.execute('DELETE FROM note_mods WHERE note_id NOT IN (SELECT note_id FROM card_notes)')
+                conn.executemany('INSERT OR REPLACE INTO note_mods VALUES (?, ?)', mods.items())
+
+                unknown_notes = [note_id for note_id, in conn.execute(
+                    'SELECT DISTINCT note_id FROM card_notes WHERE note_id NOT IN (SELECT note_id FROM note_mods)')]
+                fetched_mods = self._note_mod_times(unknown_notes) if unknown_notes else {}
+                if fetched_mods is None:
+                    self._set_meta(conn, 'note_mods', 'missing')  # Next refresh downloads everything
+                else:
+                    conn.executemany('INSERT OR REPLACE INTO note_mods VALUES (?, ?)', fetched_mods.items())
+
+            hebrew_cards = self._write_metadata(deck_name, conn)
+            print(f"✓ Refreshed cache: {len(fetched)} cards updated, {len(removed_ids)} removed, "
+                  f"{hebrew_cards} Hebrew cards")
+
+            return {
+                'success': True,
+                'total_cards': len(card_ids),
+                'hebrew_cards': hebrew_cards,
+                'updated': len(fetched),
+                'removed': len(removed_ids)
+            }
+
+        except Exception as e:
+            print(f"Error refreshing deck: {e}")
+            return {'success': False, 'error': str(e)}
+
+        finally:
+            conn.close()
+
+    def _download_cards(self, card_ids: List[int]) -> List[Dict]:
+        """Fetch cardsInfo for the given cards in batches"""
+        return asyncio.run(self._download_cards_async(card_ids))
+
+    async def _download_cards_async(self, card_ids: List[int]) -> List[Dict]:
+        """Fetch cardsInfo batches concurrently, returning cards in card_ids order"""
+        client = AsyncAnkiClient()
+        batches = [card_ids[i:i + DOWNLOAD_BATCH_SIZE] for i in range(0, len(card_ids), DOWNLOAD_BATCH_SIZE)]
+        downloaded = 0
+
+        async def download(batch: List[int]) -> List[Dict]:
+            nonlocal downloaded
+            cards_info = await client.run(anki_request, 'cardsInfo', {'cards': batch})
+            downloaded += len(batch)
+            print(f"Downloaded {downloaded}/{len(card_ids)} cards")
+            return cards_info or []
+
+        results = await asyncio.gather(*(download(batch) for batch in batches))
+        return [card for cards_info in results for card in cards_info]
+
+    def _note_mod_times(self, note_ids) -> Optional[Dict[int, int]]:
+        """Modification time of each note from one notesModTime request (None if unavailable)"""
+        result = anki_request('notesModTime', {'notes': sorted(note_ids)})
+        if result is None:
+            return None
+        return {entry['noteId']: entry['mod'] for entry in result}
+
+    def _open_deck_db(self, deck_name: str) -> Optional[sqlite3.Connection]:
+        """Open the deck database, migrating a pickled cache first; None if missing or outdated"""
+        cache_path = self._get_cache_path(deck_name)
+        if not cache_path.exists() and not self._migrate_legacy_cache(deck_name):
+            return None
+
+        try:
+            conn = sqlite3.connect(cache_path)
+        except sqlite3.Error as e:
+            print(f"Error opening cached deck: {e}")
+            return None
+
+        try:
+            version = self._get_meta(conn, 'cache_version')
+        except sqlite3.Error as e:
+            print(f"Error opening cached deck: {e}")
+            conn.close()
+            return None
+
+        if version != CACHE_VERSION:
+            print(f"Cached deck has format {version}, expected {CACHE_VERSION} - run 'cache-deck --force'")
+            conn.close()
+            return None
+        return conn
+
+    def _create_deck_db(self, deck_name: str, processed_cards: List[Dict],
+                        card_notes: Dict[int, int], note_mods: Optional[Dict[int, int]]):
+        """Write a fresh deck database, replacing the current one atomically"""
+        cache_path = self._get_cache_path(deck_name)
+        temp_path = cache_path.with_suffix('.sqlite.tmp')
+        temp_path.unlink(missing_ok=True)
+
+        conn = sqlite3.connect(temp_path)
+        try:
+            with conn:
+                conn.executescript(DECK_SCHEMA)
+                self._set_meta(conn, 'cache_version', CACHE_VERSION)
+                self._set_meta(conn, 'note_mods', 'missing' if note_mods is None else 'complete')
+                self._insert_cards(conn, processed_cards)
+                conn.executemany('INSERT INTO card_notes VALUES (?, ?)', card_notes.items())
+                conn.executemany('INSERT INTO note_mods VALUES (?, ?)', (note_mods or {}).items())
+            os.replace(temp_path, cache_path)
+            self._write_metadata(deck_name, conn)
+        finally:
+            conn.close()
+
+    def _migrate_legacy_cache(self, deck_name: str) -> bool:
+        """Convert a pickled cache (format 1.0, a list of processed cards) into the deck database"""
+        legacy_path = self._get_legacy_cache_path(deck_name)
+        if not legacy_path.exists():
+            return False
+
+        print(f"Migrating pickled deck cache to SQLite: {deck_name}")
+        try:
+            with open(legacy_path, 'rb') as f:
+                processed_cards = pickle.load(f)
+
+            card_notes = {card['card_id']: card['note_id'] for card in processed_cards}
+            self._create_deck_db(deck_name, processed_cards, card_notes, None)
+        except Exception as e:
+            print(f"Error migrating cached deck: {e}")
+            return False
+
+        legacy_path.unlink()
+        return True
+
+    def _insert_cards(self, conn: sqlite3.Connection, processed_cards: List[Dict]):
+        """Insert processed cards with their keys and inflected forms"""
+        key_ids = dict(conn.execute('SELECT key, key_id FROM keys'))
+        next_key_id = max(key_ids.values(), default=-1) + 1
+
+        new_keys = []
+        for card in processed_cards:
+            key = card['normalized_hebrew']
+            if key not in key_ids:
+                key_ids[key] = next_key_id
+                new_keys.append((next_key_id, key))
+                next_key_id += 1
+
+        conn.executemany('INSERT INTO keys VALUES (?, ?)', new_keys)
+        conn.executemany('INSERT INTO cards VALUES (?, ?, ?, ?, ?, ?, ?, ?)', (
+            (card['card_id'], card['note_id'], key_ids[card['normalized_hebrew']], card['hebrew'],
+             card['english'], ' '.join(card['tags']), json.dumps(card['fields'], ensure_ascii=False),
+             card_root(card))
+            for card in processed_cards
+        ))
+        conn.executemany('INSERT INTO inflections VALUES (?, ?)', (
+            (form, card_id)
+            for form, card_ids in build_inflection_index(processed_cards).items()
+            for card_id in card_ids
+        ))
+
+    def _delete_cards(self, conn: sqlite3.Connection, card_ids):
+        """Remove cards and everything recorded about them"""
+        rows = [(card_id,) for card_id in card_ids]
+        conn.executemany('DELETE FROM cards WHERE card_id = ?', rows)
+        conn.executemany('DELETE FROM inflections WHERE card_id = ?', rows)
+        conn.executemany('DELETE FROM card_notes WHERE card_id = ?', rows)
+
+    def _card_details(self, conn: sqlite3.Connection, card_ids: List[int]) -> Dict[int, tuple]:
+        """Text columns of the given cards, for lazily opened card stores"""
+        details = {}
+
+        # Stay under SQLite's bound parameter limit
+        for i in range(0, len(card_ids), DOWNLOAD_BATCH_SIZE):
+            batch = card_ids[i:i + DOWNLOAD_BATCH_SIZE]
+            placeholders = ', '.join('?' * len(batch))
+            query = f'SELECT card_id, hebrew, english, tags, fields FROM cards WHERE card_id IN ({placeholders})'
+            for card_id, hebrew, english, tags, fields in conn.execute(query, batch):
+                details[card_id] = (hebrew, english, tags.split(), json.loads(fields))
+
+        return details
+
+    @staticmethod
+    def _get_meta(conn: sqlite3.Connection, name: str) -> Optional[str]:
+        row = conn.execute('SELECT value FROM meta WHERE name = ?', (name,)).fetchone()
+        return row[0] if row else None
+
+    @staticmethod
+    def _set_meta(conn: sqlite3.Connection, name: str, value: str):
+        conn.execute('INSERT OR REPLACE INTO meta VALUES (?, ?)', (name, value))
+
+    def _read_metadata(self, deck_name: str) -> Dict:
+        """Raw metadata of a cached deck"""
+        with open(self._get_metadata_path(deck_name), 'r') as f:
+            return json.load(f)
+
+    def _write_metadata(self, deck_name: str, conn: sqlite3.Connection, previous: Optional[Dict] = None) -> int:
+        """
+        Write deck metadata from the database contents
+
+        Passing the previous metadata keeps its snapshot stamp (nothing changed),
+        so indexes saved against it stay valid; otherwise a new stamp is taken.
+
+        Returns:
+            Number of cached Hebrew cards
+        """
+        def count(query: str) -> int:
+            return conn.execute(query).fetchone()[0]
+
+        now = datetime.now().isoformat()
+
+        metadata = {
+            'deck_name': deck_name,
+            'cached_at': previous['cached_at'] if previous else now,
+            'refreshed_at': now,
+            'card_count': count('SELECT COUNT(*) FROM card_notes'),
+            'hebrew_cards': count('SELECT COUNT(*) FROM cards'),
+            'unique_keys': count('SELECT COUNT(*) FROM keys'),
+            'inflection_forms': count('SELECT COUNT(DISTINCT form) FROM inflections'),
+            'roots': count('SELECT COUNT(DISTINCT root) FROM cards'),
+            'cache_version': CACHE_VERSION
+        }
+
+        with open(self._get_metadata_path(deck_name), 'w') as f:
+            json.dump(metadata, f, indent=2)
+        return metadata['hebrew_cards']
+
     def _process_cards(self, cards_info: List[Dict]) -> List[Dict]:
         """Process raw card data into searchable format"""
         processed_cards = []
@@ -143,6 +516,7 @@ class DeckCache:
                 'tags': card_info.get('tags', []),
                 'fields': {name: data['value'] for name, data in card_info['fields'].items()}
             }
+            processed_card['root'] = extract_shoresh(processed_card['fields'], processed_card['tags'])
 
             processed_cards.append(processed_card)
 
@@ -153,28 +527,87 @@ class DeckCache:
         if not text:
             return ""
 
-        import re
         # Remove HTML tags
         clean = re.sub(r'<[^>]+>', '', text)
         # Remove extra whitespace
         clean = ' '.join(clean.split())
         return clean.strip()
 
-    def load_cached_deck(self, deck_name: str) -> Optional[List[Dict]]:
-        """Load deck from cache"""
-        cache_path = self._get_cache_path(deck_name)
+    def load_cached_deck(self, deck_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Open the cached deck lazily (pickled caches are migrated on first use)
+
+        Only ids, normalized keys and the inflection/root indexes are read;
+        card text is fetched from the database when a card is first looked at.
+        """
+        conn = self._open_deck_db(deck_name)
+        if conn is None:
+            return None
+
+        keys = []
+        key_rows = {}
+        for key_id, key in conn.execute('SELECT key_id, key FROM keys ORDER BY key_id'):
+            key_rows[key_id] = len(keys)
+            keys.append(key)
+
+        rows = conn.execute('SELECT card_id, note_id, key_id FROM cards ORDER BY card_id').fetchall()
+        store = CardStore.lazy(
+            (row[0] for row in rows),
+            (row[1] for row in rows),
+            keys,
+            (key_rows[row[2]] for row in rows),
+            partial(self._card_details, conn)
+        )
+
+        inflections: Dict[str, List[int]] = {}
+        for form, card_id in conn.execute('SELECT form, card_id FROM inflections'):
+            inflections.setdefault(form, []).append(card_id)
+
+        roots: Dict[str, List[int]] = {}
+        for root, card_id in conn.execute('SELECT root, card_id FROM cards WHERE root IS NOT NULL'):
+            roots.setdefault(root, []).append(card_id)
+
+        return {'cache_version': CACHE_VERSION, 'store': store, 'inflections': inflections, 'roots': roots}
+
+    def save_index(self, deck_name: str, index_name: str, index: Any) -> bool:
+        """
+        Persist a search index built from the cached deck
 
-        if not cache_path.exists():
+        The index is stamped with the deck snapshot time so it is discarded
+        automatically once the deck cache is refreshed.
+        """
+        info = self.get_cache_info(deck_name)
+        if not info:
+            return False
+
+        try:
+            with open(self._get_index_path(deck_name, index_name), 'wb') as f:
+                pickle.dump({'cached_at': info['cached_at'], 'index': index}, f)
+            return True
+        except Exception as e:
+            print(f"Error saving {index_name} index: {e}")
+            return False
+
+    def load_index(self, deck_name: str, index_name: str) -> Optional[Any]:
+        """Load a persisted search index if it matches the current deck snapshot"""
+        index_path = self._get_index_path(deck_name, index_name)
+        info = self.get_cache_info(deck_name)
+
+        if not info or not index_path.exists():
             return None
 
         try:
-            with open(cache_path, 'rb') as f:
-                return pickle.load(f)
+            with open(index_path, 'rb') as f:
+                stored = pickle.load(f)
         except Exception as e:
-            print(f"Error loading cached deck: {e}")
+            print(f"Error loading {index_name} index: {e}")
+            return None
+
+        if stored.get('cached_at') != info['cached_at']:
             return None
+        return stored['index']
 
-    def get_cached_deck(self, deck_name: str, max_age_hours: int = None, auto_refresh: bool = False) -> Optional[List[Dict]]:
+    def get_cached_deck(self, deck_name: str, max_age_hours: int = None, auto_refresh: bool = False) -> Optional[Dict[str, Any]]:
         """
         Get deck data, using cache if valid or refreshing if needed
 
@@ -184,7 +617,9 @@ class DeckCache:
             auto_refresh: Whether to automatically refresh stale cache
 
         Returns:
-            List of processed card dictionaries, or None if unavailable
+            Deck table with the columnar card 'store', the 'inflections'
+            form -> card ids and 'roots' root -> card ids indexes, or None if
+            unavailable
         """
         # Check if cache is valid (never expires by default)
         if self.is_cache_valid(deck_name, max_age_hours):
@@ -194,7 +629,7 @@ class DeckCache:
         # Cache is stale or missing
         if auto_refresh:
             print(f"Cache missing/stale, refreshing deck: {deck_name}")
-            result = self.cache_deck(deck_name)
+            result = self.refresh_deck(deck_name)
             if result['success']:
                 return self.load_cached_deck(deck_name)
         else:
@@ -211,14 +646,21 @@ class DeckCache:
             meta_path = self._get_metadata_path(deck_name)
 
             cache_path.unlink(missing_ok=True)
+            self._get_legacy_cache_path(deck_name).unlink(missing_ok=True)
             meta_path.unlink(missing_ok=True)
+            for file_path in self.cache_dir.glob(f"{self._get_safe_name(deck_name)}_*_index.pkl"):
+                file_path.unlink()
             print(f"Cleared cache for deck: {deck_name}")
         else:
             # Clear all cache files
+            for file_path in self.cache_dir.glob("*_cache.sqlite"):
+                file_path.unlink()
             for file_path in self.cache_dir.glob("*_cache.pkl"):
                 file_path.unlink()
             for file_path in self.cache_dir.glob("*_meta.json"):
                 file_path.unlink()
+            for file_path in self.cache_dir.glob("*_index.pkl"):
+                file_path.unlink()
             print("Cleared all deck caches")
 
     def get_cache_info(self, deck_name: str) -> Optional[Dict]:
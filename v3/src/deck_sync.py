@@ -3,10 +3,15 @@ Deck synchronization module for Anki-Assimil V3
 Handles syncing CSV data to Anki decks via AnkiConnect
 """
 from pathlib import Path
-from typing import List, Dict, Set, Optional
+from typing import List, Dict, Set, Optional, Tuple
 from rich.console import Console
+from rich.progress import BarColumn, MofNCompleteColumn, Progress, TextColumn, TimeElapsedColumn
+import asyncio
 import csv
-from .anki_api import anki_request, create_note, create_deck
+import time
+from .anki_api import (AsyncAnkiClient, anki_request, create_note, create_notes, can_add_notes, create_deck,
+                       get_client_setting, store_media_file)
+from .media_manifest import MediaManifest, file_digest, get_media_manifest_file
 
 console = Console()
 
@@ -85,7 +90,81 @@ def get_existing_cards_by_media(deck_name: str) -> Dict[str, int]:
     console.print(f"[green]✓[/green] Found {processed_count} existing cards in {deck_name}")
     return existing_cards
 
-def sync_phrase_cards(translations: List[Dict], deck_name: str, note_type: str = "Basic (and reversed card)") -> Dict[str, int]:
+def _first_field(note: Dict) -> str:
+    """Value of a note's first field, which Anki checks for duplicates"""
+    return next(iter(note["fields"].values()), "")
+
+def find_added_notes(notes: List[Dict]) -> List[bool]:
+    """
+    Check which notes are now in Anki, by deck, note type and first field
+
+    Searches the notes added today in each deck, so it is only meant for
+    notes this run just tried to add.
+
+    Args:
+        notes: Note dictionaries (deckName, modelName, fields, tags)
+
+    Returns:
+        Whether each note was found
+    """
+    found = set()
+    for deck_name in {note["deckName"] for note in notes}:
+        note_ids = anki_request("findNotes", {"query": f'deck:"{deck_name}" added:1'})
+        if not note_ids:
+            continue
+
+        for info in anki_request("notesInfo", {"notes": note_ids}) or []:
+            fields = sorted(info.get("fields", {}).values(), key=lambda field: field["order"])
+            if fields:
+                found.add((deck_name, info.get("modelName"), fields[0]["value"]))
+
+    return [(note["deckName"], note["modelName"], _first_field(note)) in found for note in notes]
+
+def add_notes_batched(notes: List[Dict], batch_size: int = 100) -> List[bool]:
+    """
+    Create notes with one addNotes request per batch
+
+    Each batch is pre-validated with canAddNotes so notes Anki would reject
+    (empty or duplicate) are not sent, and only the first of several notes
+    with the same deck, note type and first field is sent. Notes the batch
+    request fails to add are retried with one addNote request each.
+
+    Args:
+        notes: Note dictionaries (deckName, modelName, fields, tags)
+        batch_size: Notes per addNotes request
+
+    Returns:
+        Whether each note was created
+    """
+    created = [False] * len(notes)
+
+    for start in range(0, len(notes), batch_size):
+        batch = {}
+        for i in range(start, min(start + batch_size, len(notes))):
+            note = notes[i]
+            batch.setdefault((note["deckName"], note["modelName"], _first_field(note)), i)
+        batch = list(batch.values())
+
+        addable = can_add_notes([notes[i] for i in batch])
+        if addable is not None:
+            batch = [i for i, ok in zip(batch, addable) if ok]
+
+        note_ids = create_notes([notes[i] for i in batch])
+        if note_ids is None:
+            # addNotes reports an error for the whole request when any note fails, even
+            # though it added the others; count only notes found in Anki, retry the rest
+            note_ids = [True if found else None for found in find_added_notes([notes[i] for i in batch])]
+
+        for i, note_id in zip(batch, note_ids):
+            if not note_id:
+                note = notes[i]
+                note_id = create_note(note["deckName"], note["modelName"], note["fields"], note["tags"])
+            created[i] = bool(note_id)
+
+    return created
+
+def sync_phrase_cards(translations: List[Dict], deck_name: str, note_type: str = "Basic (and reversed card)",
+                      batch_size: int = 100) -> Dict[str, int]:
     """
     Sync phrase cards in Anki (create missing cards only)
     
@@ -96,6 +175,7 @@ def sync_phrase_cards(translations: List[Dict], deck_name: str, note_type: str =
         translations: List of translation dictionaries
         deck_name: Target deck name
         note_type: Anki note type to use
+        batch_size: Notes per addNotes request
 
     Returns:
         Dictionary with count of created cards
@@ -134,6 +214,10 @@ def sync_phrase_cards(translations: List[Dict], deck_name: str, note_type: str =
     if missing_translations:
         console.print(f"[bold blue]Creating {len(missing_translations)} missing phrase cards...[/bold blue]")
 
+        # Generate standardized tags using centralized system
+        from .tags import generate_lesson_tags
+
+        notes = []
         for translation in missing_translations:
             # Prepare card fields
             fields = {
@@ -141,9 +225,6 @@ def sync_phrase_cards(translations: List[Dict], deck_name: str, note_type: str =
                 "Back": translation['english']
             }
 
-            # Generate standardized tags using centralized system
-            from .tags import generate_lesson_tags
-            
             # Extract lesson number from ID (L001.S01 -> 1)
             lesson_id = translation['id']
             lesson_num = int(lesson_id.split('.')[0][1:])  # L001 -> 1
@@ -151,10 +232,16 @@ def sync_phrase_cards(translations: List[Dict], deck_name: str, note_type: str =
             # Generate standardized lesson tags (assimil, assimil::L01)
             tags = generate_lesson_tags('assimil', lesson_num)
 
-            # Create the card
-            note_id = create_note(deck_name, note_type, fields, tags)
+            notes.append({
+                "deckName": deck_name,
+                "modelName": note_type,
+                "fields": fields,
+                "tags": tags
+            })
 
-            if note_id:
+        # Create the cards
+        for translation, created in zip(missing_translations, add_notes_batched(notes, batch_size)):
+            if created:
                 created_count += 1
                 console.print(f"  ✓ {translation['id']}: {translation['hebrew'][:30]}...")
             else:
@@ -174,6 +261,117 @@ def get_media_mapping_file(course_dir: Path) -> Path:
     course_name = course_dir.name.replace(" ", "_").replace("/", "_")
     return Path("data") / f"media_mapping_{course_name}.json"
 
+MEDIA_MAPPING_FORMAT = 2
+
+def _anki_media_filename(parent_dir: str, filename: str) -> Optional[str]:
+    """
+    Prefixed Anki filename for a course MP3, or None if it is not lesson audio
+
+    Args:
+        parent_dir: Name of the directory holding the file
+        filename: File name without .mp3
+    """
+    import re
+
+    # Match lesson directory pattern: L001-Hebrew ASSIMIL
+    lesson_match = re.match(r'L(\d{3})-Hebrew ASSIMIL', parent_dir)
+    if not lesson_match:
+        return None
+    lesson_num = lesson_match.group(1)  # 001
+
+    # Skip T00-TRANSLATE files
+    if filename == 'T00-TRANSLATE':
+        return None
+
+    # Handle different filename patterns:
+    # S00-TITLE.mp3 -> assimil-L003.S00.mp3
+    # S01.mp3 -> assimil-L003.S01.mp3
+    # N3.mp3 -> assimil-L003.N3.mp3
+    # T05.mp3 -> assimil-L003.T05.mp3
+
+    base_filename = filename
+    if '-' in filename:
+        # Remove suffix like -TITLE, -TRANSLATE
+        base_filename = filename.split('-')[0]
+
+    # Build prefixed anki filename: assimil-L003.S00.mp3
+    return f"assimil-L{lesson_num}.{base_filename}.mp3"
+
+def _scan_media_directories(course_dir: Path, cached: Dict[str, Dict]) -> Tuple[Dict[str, Dict], int]:
+    """
+    Walk the course tree, listing only directories whose mtime changed
+
+    A directory's mtime changes when files are added, removed or renamed in
+    it, so an unchanged directory keeps its cached file and subdirectory lists.
+
+    Args:
+        course_dir: Base course directory path
+        cached: Relative directory -> {mtime, subdirs, files} from the mapping file
+
+    Returns:
+        Updated directory entries and the number of directories rescanned
+    """
+    import os
+
+    directories = {}
+    rescanned = 0
+    pending = ['']
+
+    while pending:
+        relative_dir = pending.pop()
+        directory = course_dir / relative_dir
+        try:
+            mtime = directory.stat().st_mtime
+        except FileNotFoundError:
+            continue
+
+        entry = cached.get(relative_dir)
+        if not entry or entry['mtime'] != mtime:
+            rescanned += 1
+            entry = {'mtime': mtime, 'subdirs': [], 'files': {}}
+            for child in os.scandir(directory):
+                if child.is_dir():
+                    entry['subdirs'].append(child.name)
+                elif child.name.endswith('.mp3'):
+                    anki_filename = _anki_media_filename(directory.name, child.name[:-len('.mp3')])
+                    if anki_filename:
+                        entry['files'][anki_filename] = f"{relative_dir}/{child.name}" if relative_dir else child.name
+
+        directories[relative_dir] = entry
+        pending.extend(f"{relative_dir}/{name}" if relative_dir else name for name in entry['subdirs'])
+
+    return directories, rescanned
+
+def update_media_mapping_file(course_dir: Path, cached: Dict[str, Dict] = None) -> Dict[str, str]:
+    """
+    Bring the media mapping file up to date, rescanning only changed directories
+
+    Args:
+        course_dir: Base course directory path
+        cached: Directory entries from the current mapping file (None scans everything)
+
+    Returns:
+        Dictionary mapping anki filename to relative path
+    """
+    import json
+
+    directories, rescanned = _scan_media_directories(course_dir, cached or {})
+    mapping = {anki_filename: relative_path
+               for entry in directories.values()
+               for anki_filename, relative_path in entry['files'].items()}
+
+    if directories != cached:
+        # Save mapping to file
+        mapping_file = get_media_mapping_file(course_dir)
+        mapping_file.parent.mkdir(exist_ok=True)
+
+        with open(mapping_file, 'w', encoding='utf-8') as f:
+            json.dump({'format': MEDIA_MAPPING_FORMAT, 'directories': directories}, f, indent=2, ensure_ascii=False)
+
+        console.print(f"[green]✓[/green] Rescanned {rescanned} of {len(directories)} directories, "
+                      f"mapping has {len(mapping)} entries: {mapping_file}")
+    return mapping
+
 def create_media_mapping_file(course_dir: Path) -> Dict[str, str]:
     """
     Create a complete media mapping file for the entire Assimil directory
@@ -185,60 +383,15 @@ def create_media_mapping_file(course_dir: Path) -> Dict[str, str]:
     Returns:
         Dictionary mapping anki filename to relative path
     """
-    import re
-    import json
-    
     console.print(f"[bold blue]Creating media mapping file for {course_dir}...[/bold blue]")
-    
-    mapping = {}
-    mp3_files = list(course_dir.rglob("*.mp3"))
-    
-    console.print(f"Found {len(mp3_files)} MP3 files")
-    
-    for mp3_file in mp3_files:
-        # Get relative path from course directory
-        relative_path = str(mp3_file.relative_to(course_dir))
-        
-        parent_dir = mp3_file.parent.name
-        filename = mp3_file.stem  # filename without .mp3
-        
-        # Match lesson directory pattern: L001-Hebrew ASSIMIL
-        lesson_match = re.match(r'L(\d{3})-Hebrew ASSIMIL', parent_dir)
-        if lesson_match:
-            lesson_num = lesson_match.group(1)  # 001
-            
-            # Skip T00-TRANSLATE files
-            if filename == 'T00-TRANSLATE':
-                continue
-                
-            # Handle different filename patterns:
-            # S00-TITLE.mp3 -> assimil-L003.S00.mp3
-            # S01.mp3 -> assimil-L003.S01.mp3
-            # N3.mp3 -> assimil-L003.N3.mp3
-            # T05.mp3 -> assimil-L003.T05.mp3
-            
-            base_filename = filename
-            if '-' in filename:
-                # Remove suffix like -TITLE, -TRANSLATE
-                base_filename = filename.split('-')[0]
-            
-            # Build prefixed anki filename: assimil-L003.S00.mp3
-            anki_filename = f"assimil-L{lesson_num}.{base_filename}.mp3"
-            mapping[anki_filename] = relative_path
-    
-    # Save mapping to file
-    mapping_file = get_media_mapping_file(course_dir)
-    mapping_file.parent.mkdir(exist_ok=True)
-    
-    with open(mapping_file, 'w', encoding='utf-8') as f:
-        json.dump(mapping, f, indent=2, ensure_ascii=False)
-    
-    console.print(f"[green]✓[/green] Created mapping file with {len(mapping)} entries: {mapping_file}")
-    return mapping
+    return update_media_mapping_file(course_dir)
 
 def load_media_mapping(course_dir: Path) -> Dict[str, Path]:
     """
     Load media mapping from file, creating it if it doesn't exist
+
+    Only directories whose mtime changed are rescanned. Mapped files are not
+    checked for existence here; callers check the files they actually use.
     
     Args:
         course_dir: Base course directory path
@@ -257,34 +410,34 @@ def load_media_mapping(course_dir: Path) -> Dict[str, Path]:
     else:
         # Load existing mapping
         with open(mapping_file, 'r', encoding='utf-8') as f:
-            relative_mapping = json.load(f)
+            stored = json.load(f)
+
+        if stored.get('format') != MEDIA_MAPPING_FORMAT:
+            # Flat mapping without directory mtimes
+            console.print(f"[yellow]Media mapping file has an old format, rebuilding: {mapping_file}[/yellow]")
+            relative_mapping = create_media_mapping_file(course_dir)
+        else:
+            relative_mapping = update_media_mapping_file(course_dir, stored['directories'])
         console.print(f"[green]✓[/green] Loaded media mapping with {len(relative_mapping)} entries")
     
     # Convert relative paths to absolute paths
-    absolute_mapping = {}
-    for anki_filename, relative_path in relative_mapping.items():
-        absolute_path = course_dir / relative_path
-        if absolute_path.exists():
-            absolute_mapping[anki_filename] = absolute_path
-        else:
-            console.print(f"[yellow]Warning:[/yellow] File not found: {relative_path}")
-    
-    return absolute_mapping
+    return {anki_filename: course_dir / relative_path for anki_filename, relative_path in relative_mapping.items()}
 
 
 def sync_media_files(translations: List[Dict], config: Dict) -> Dict[str, int]:
     """
     Upload media files directly from course directory to Anki using AnkiConnect
-    Uses batch existence check with set difference for optimal performance
+    Uses batch existence check with set difference for optimal performance,
+    plus the media manifest to re-send files whose content changed since upload
     
     Args:
         translations: List of translation dictionaries with sound fields
         config: Configuration with course directory path
         
     Returns:
-        Dictionary with counts of uploaded, skipped, and failed files
+        Dictionary with counts of uploaded, updated, skipped, and failed files
     """
-    from .anki_api import store_media_file, get_existing_assimil_media
+    from .anki_api import get_existing_assimil_media
     import re
     import os
     
@@ -314,36 +467,186 @@ def sync_media_files(translations: List[Dict], config: Dict) -> Dict[str, int]:
     
     # Fast set difference to find missing files
     missing_files = needed_files - existing_files
-    skipped_count = len(needed_files) - len(missing_files)
+
+    # Files already in Anki are re-sent only if their content changed since the last upload.
+    # Every one is stat'ed: overwriting a file in place leaves its directory's mtime alone,
+    # so the directory scan only tells which files exist
+    manifest = MediaManifest(get_media_manifest_file(course_dir))
+    changed_files = manifest.find_changed(sorted(needed_files & existing_files), media_lookup)
+    skipped_count = len(needed_files) - len(missing_files) - len(changed_files)
     
-    console.print(f"Needed: {len(needed_files)}, Existing: {len(existing_files)}, Missing: {len(missing_files)}")
+    console.print(f"Needed: {len(needed_files)}, Existing: {len(existing_files)}, Missing: {len(missing_files)}, "
+                  f"Changed: {len(changed_files)}")
     
     if skipped_count > 0:
         console.print(f"[green]✓[/green] {skipped_count} files already exist, skipping")
     
-    # Upload only missing files
-    for prefixed_filename in sorted(missing_files):
+    # Upload only missing and changed files, several at a time
+    upload_files = sorted(missing_files | changed_files)
+    uploaded = asyncio.run(upload_media_files_async(
+        upload_files, media_lookup,
+        workers=config['anki'].get('media_upload_workers', 8),
+        retries=config['anki'].get('media_upload_retries', 2),
+        replace=changed_files,
+        manifest=manifest
+    ))
+    manifest.save()
+
+    uploaded_count = sum(uploaded)
+    updated_count = sum(ok for filename, ok in zip(upload_files, uploaded) if filename in changed_files)
+    failed_count = len(uploaded) - uploaded_count
+    
+    console.print(f"\n[green]✓[/green] Media sync: {uploaded_count} uploaded ({updated_count} changed), "
+                  f"{skipped_count} skipped, {failed_count} failed")
+    
+    return {"uploaded": uploaded_count, "updated": updated_count, "skipped": skipped_count, "failed": failed_count}
+
+def verify_media_files(config: Dict, fix: bool = False) -> Dict[str, int]:
+    """
+    Compare Anki's copies of course media with the local files
+
+    Anki's media folder is read directly when it is on this machine: a size
+    difference is drift without hashing, equal sizes are compared by hash.
+    Otherwise each copy is fetched with retrieveMediaFile and hashed.
+
+    Args:
+        config: Configuration with course directory path
+        fix: Re-upload files whose Anki copy differs
+
+    Returns:
+        Dictionary with counts of verified, drifted, and fixed files
+    """
+    from .anki_api import get_existing_assimil_media
+    import base64
+    import hashlib
+    import os
+
+    course_dir = Path(os.path.expanduser(config['paths']['assimil_course_dir']))
+    console.print(f"[bold blue]Verifying Anki media against {course_dir}...[/bold blue]")
+
+    media_lookup = load_media_mapping(course_dir)
+    manifest = MediaManifest(get_media_manifest_file(course_dir))
+    filenames = sorted(get_existing_assimil_media() & media_lookup.keys())
+
+    media_dir = anki_request("getMediaDirPath")
+    media_dir = Path(media_dir) if media_dir and Path(media_dir).is_dir() else None
+    if media_dir is None:
+        console.print("[yellow]Anki media folder not reachable, downloading copies to compare[/yellow]")
+
+    # Mapped files are only checked for existence once selected
+    for filename in [filename for filename in filenames if not media_lookup[filename].exists()]:
+        console.print(f"  ⚠ Missing locally: {filename}")
+        filenames.remove(filename)
+
+    drifted = []
+    for filename in filenames:
+        local = manifest.local_entry(filename, media_lookup[filename])
+
+        if media_dir is not None:
+            anki_copy = media_dir / filename
+            matches = (anki_copy.exists() and anki_copy.stat().st_size == local['size']
+                       and file_digest(anki_copy) == local['sha1'])
+        else:
+            content = anki_request("retrieveMediaFile", {"filename": filename})
+            data = base64.b64decode(content) if content else b''
+            matches = len(data) == local['size'] and hashlib.sha1(data).hexdigest() == local['sha1']
+
+        if matches:
+            manifest.record(filename, local)
+        else:
+            drifted.append(filename)
+            console.print(f"  ✗ Differs from local file: {filename}")
+
+    fixed_count = 0
+    if drifted and fix:
+        uploaded = asyncio.run(upload_media_files_async(
+            drifted, media_lookup,
+            workers=config['anki'].get('media_upload_workers', 8),
+            retries=config['anki'].get('media_upload_retries', 2),
+            replace=set(drifted),
+            manifest=manifest
+        ))
+        fixed_count = sum(uploaded)
+    manifest.save()
+
+    console.print(f"\n[green]✓[/green] Verified {len(filenames) - len(drifted)}/{len(filenames)} media files, "
+                  f"{len(drifted)} differ" + (f", {fixed_count} re-uploaded" if fix else ""))
+
+    return {"verified": len(filenames) - len(drifted), "drifted": len(drifted), "fixed": fixed_count}
+
+async def upload_media_files_async(filenames: List[str], media_lookup: Dict[str, Path],
+                                   workers: int = 8, retries: int = 2, replace: Set[str] = frozenset(),
+                                   manifest: Optional[MediaManifest] = None) -> List[bool]:
+    """
+    Upload media files to Anki with a bounded number of concurrent uploads
+
+    Failed uploads are retried with backoff (anki.retry_backoff seconds,
+    doubled after each retry). Progress is shown as a bar and the run ends
+    with a throughput summary.
+
+    Args:
+        filenames: Prefixed Anki filenames to upload
+        media_lookup: Anki filename -> source file path
+        workers: Uploads in flight at once
+        retries: Extra attempts per file after a failed upload
+        replace: Files to overwrite in Anki (others are uploaded without replacing)
+        manifest: Records the content of each uploaded file when given
+
+    Returns:
+        Whether each file was uploaded, in filenames order
+    """
+    if not filenames:
+        return []
+
+    client = AsyncAnkiClient(workers)
+    backoff = get_client_setting("retry_backoff")
+    uploaded_bytes = 0
+
+    progress = Progress(TextColumn("[bold blue]Uploading media"), BarColumn(), MofNCompleteColumn(),
+                        TimeElapsedColumn(), console=console)
+    task = progress.add_task("upload", total=len(filenames))
+
+    async def upload(prefixed_filename: str) -> bool:
+        nonlocal uploaded_bytes
+
         # Look up the original file path using prefixed filename
         original_path = media_lookup.get(prefixed_filename)
-        
-        if not original_path:
-            console.print(f"  ⚠ Missing: {prefixed_filename}")
-            failed_count += 1
-            continue
-            
+
+        if not original_path or not original_path.exists():
+            progress.console.print(f"  ⚠ Missing: {prefixed_filename}")
+            progress.advance(task)
+            return False
+
+        # Hash before uploading so the manifest describes what was sent
+        entry = None
+        if manifest is not None:
+            entry = await asyncio.to_thread(manifest.local_entry, prefixed_filename, original_path)
+
         # Store in Anki using AnkiConnect with the prefixed filename
-        result = store_media_file(prefixed_filename, original_path, delete_existing=False)
-        
-        if result:
-            uploaded_count += 1
-            console.print(f"  ✓ {prefixed_filename} <- {original_path.name}")
-        else:
-            failed_count += 1
-            console.print(f"  ✗ Failed: {prefixed_filename}")
-    
-    console.print(f"\n[green]✓[/green] Media sync: {uploaded_count} uploaded, {skipped_count} skipped, {failed_count} failed")
-    
-    return {"uploaded": uploaded_count, "skipped": skipped_count, "failed": failed_count}
+        delete_existing = prefixed_filename in replace
+        for attempt in range(retries + 1):
+            if attempt:
+                await asyncio.sleep(backoff * 2 ** (attempt - 1))
+            if await client.run(store_media_file, prefixed_filename, original_path, delete_existing=delete_existing):
+                uploaded_bytes += original_path.stat().st_size
+                if entry is not None:
+                    manifest.record(prefixed_filename, entry)
+                progress.advance(task)
+                return True
+
+        progress.console.print(f"  ✗ Failed after {retries + 1} attempts: {prefixed_filename}")
+        progress.advance(task)
+        return False
+
+    start = time.perf_counter()
+    with progress:
+        results = await asyncio.gather(*(upload(filename) for filename in filenames))
+    elapsed = max(time.perf_counter() - start, 1e-6)
+
+    uploaded = sum(results)
+    console.print(f"Uploaded {uploaded} files ({uploaded_bytes / 1e6:.1f} MB) in {elapsed:.1f}s: "
+                  f"{uploaded / elapsed:.1f} files/s, {uploaded_bytes / 1e6 / elapsed:.2f} MB/s")
+    return results
 
 def sync_phrases_to_anki(config: Dict) -> bool:
     """
@@ -373,7 +676,7 @@ def sync_phrases_to_anki(config: Dict) -> bool:
         return False
 
     # Sync phrase cards (create missing only)
-    results = sync_phrase_cards(translations, deck_name)
+    results = sync_phrase_cards(translations, deck_name, batch_size=config['anki'].get('note_batch_size', 100))
 
     # Sync media files to Anki's media directory
     media_results = sync_media_files(translations, config)
@@ -0,0 +1,504 @@
+"""
+Search indexes for fuzzy matching Hebrew words against deck vocabulary
+"""
+
+from bisect import insort
+from itertools import combinations
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from Levenshtein import distance as levenshtein_distance
+
+from src.tokenizer import root_letters
+
+try:
+    import numpy as np
+except ImportError:  # Only the numpy match engine needs it
+    np = None
+
+
+def letter_mask(word: str) -> int:
+    """Bitmask of the characters present in a word (collisions only weaken the bound)"""
+    mask = 0
+    for char in word:
+        mask |= 1 << (ord(char) & 63)
+    return mask
+
+
+def letter_mask_lower_bound(mask_a: int, mask_b: int) -> int:
+    """
+    Lower bound on the edit distance between two words from their letter masks
+
+    Every letter present in one word but absent from the other needs at least
+    one edit, so the larger one-sided difference bounds the distance from below.
+    """
+    return max((mask_a & ~mask_b).bit_count(), (mask_b & ~mask_a).bit_count())
+
+
+class TopK:
+    """
+    Bounded selection of the k best (distance, word) pairs
+
+    Once k pairs are held nothing worse than the current worst can enter, so
+    the search radius tightens to that distance (early cut-off).
+    """
+
+    def __init__(self, k: Optional[int], radius: int):
+        self.k = k  # None keeps every pair within the radius
+        self.radius = radius
+        self.items: List[Tuple[int, str]] = []  # Sorted (distance, word)
+
+    def offer(self, word: str, distance: int):
+        """Consider a scored word for the selection"""
+        if distance > self.radius:
+            return
+
+        item = (distance, word)
+        if self.k is None or len(self.items) < self.k:
+            insort(self.items, item)
+        elif item < self.items[-1]:
+            insort(self.items, item)
+            self.items.pop()
+        else:
+            return
+
+        if self.k is not None and len(self.items) == self.k:
+            self.radius = self.items[-1][0]
+
+    def results(self) -> List[Tuple[str, int]]:
+        """Selected (word, distance) pairs, best first"""
+        return [(word, distance) for distance, word in self.items]
+
+
+class BKTree:
+    """Burkhard-Keller tree for radius queries over strings under Levenshtein distance"""
+
+    def __init__(self, words: Iterable[str] = ()):
+        # Each node is [word, {distance_to_parent_word: child_node}]
+        self.root: Optional[list] = None
+        self.size = 0
+        self.distance_calls = 0  # Distance evaluations spent on searches
+
+        for word in words:
+            self.add(word)
+
+    def add(self, word: str):
+        """Insert a word into the tree (duplicates are ignored)"""
+        if self.root is None:
+            self.root = [word, {}]
+            self.size = 1
+            return
+
+        node = self.root
+        while True:
+            distance = levenshtein_distance(word, node[0])
+            if distance == 0:
+                return
+
+            child = node[1].get(distance)
+            if child is None:
+                node[1][distance] = [word, {}]
+                self.size += 1
+                return
+            node = child
+
+    def search(self, word: str, radius: int, limit: Optional[int] = None) -> List[Tuple[str, int]]:
+        """
+        Find indexed words within a maximum edit distance
+
+        Args:
+            word: Query word
+            radius: Maximum Levenshtein distance (inclusive)
+            limit: Keep only this many closest words (None = all)
+
+        Returns:
+            List of (word, distance) tuples sorted by distance, then word
+        """
+        top = TopK(limit, radius)
+        if self.root is None:
+            return top.results()
+
+        # Triangle inequality: only subtrees whose edge distance lies in
+        # [d - radius, d + radius] can contain words within the radius
+        stack = [self.root]
+        calls = 0
+        while stack:
+            node_word, children = stack.pop()
+            distance = levenshtein_distance(word, node_word)
+            calls += 1
+            top.offer(node_word, distance)
+
+            # The radius shrinks once the selection is full
+            low, high = distance - top.radius, distance + top.radius
+            for edge, child in children.items():
+                if low <= edge <= high:
+                    stack.append(child)
+
+        self.distance_calls += calls
+        return top.results()
+
+    def __len__(self) -> int:
+        return self.size
+
+
+class DeletionIndex:
+    """SymSpell-style index mapping deletion variants to the words that produce them"""
+
+    def __init__(self, words: Iterable[str] = (), max_depth: int = 2):
+        self.max_depth = max_depth
+        self.deletes: Dict[str, List[str]] = {}  # Deletion variant -> Indexed words
+        self.size = 0
+        self.distance_calls = 0  # Distance evaluations spent verifying candidates
+
+        for word in words:
+            self.add(word)
+
+    @staticmethod
+    def deletion_variants(word: str, depth: int) -> Set[str]:
+        """All strings reachable from word by deleting up to depth characters"""
+        variants = {word}
+        frontier = {word}
+        for _ in range(depth):
+            next_frontier = set()
+            for variant in frontier:
+                for i in range(len(variant)):
+                    next_frontier.add(variant[:i] + variant[i + 1:])
+            next_frontier -= variants
+            variants |= next_frontier
+            frontier = next_frontier
+        return variants
+
+    def add(self, word: str):
+        """Insert a word and all its deletion variants up to max_depth"""
+        for variant in self.deletion_variants(word, self.max_depth):
+            self.deletes.setdefault(variant, []).append(word)
+        self.size += 1
+
+    def search(self, word: str, radius: int, limit: Optional[int] = None) -> List[Tuple[str, int]]:
+        """
+        Find indexed words within a maximum edit distance
+
+        Any two words within distance d share a common deletion variant
+        reachable with at most d deletions from each side, so candidates
+        only need verifying with a full distance call.
+
+        Args:
+            word: Query word
+            radius: Maximum Levenshtein distance (must not exceed max_depth)
+            limit: Keep only this many closest words (None = all)
+
+        Returns:
+            List of (word, distance) tuples sorted by distance, then word
+        """
+        if radius > self.max_depth:
+            raise ValueError(f"Radius {radius} exceeds index depth {self.max_depth}")
+
+        candidates = set()
+        for variant in self.deletion_variants(word, radius):
+            candidates.update(self.deletes.get(variant, ()))
+
+        top = TopK(limit, radius)
+        for candidate in candidates:
+            # Distances beyond the current cut-off come back as cut-off + 1
+            top.offer(candidate, levenshtein_distance(word, candidate, score_cutoff=top.radius))
+
+        self.distance_calls += len(candidates)
+        return top.results()
+
+    def __len__(self) -> int:
+        return self.size
+
+
+class RootIndex:
+    """Inverted index from Hebrew roots (shoresh) to the keys built on them"""
+
+    def __init__(self, root_keys: Dict[str, Iterable[str]]):
+        self.root_keys: Dict[str, List[str]] = {root: sorted(set(keys)) for root, keys in root_keys.items()}
+        self.root_lengths = sorted({len(root) for root in self.root_keys})
+        self.distance_calls = 0  # Distance evaluations spent on searches
+
+    def candidates(self, word: str) -> Set[str]:
+        """Keys whose root letters appear in order among the word's letters"""
+        letters = root_letters(word)
+        found = set()
+
+        # Roots are 2-4 letters, so probing every ordered letter selection
+        # of the word is cheaper than testing each root as a subsequence
+        for length in self.root_lengths:
+            for selection in set(combinations(letters, length)):
+                found.update(self.root_keys.get(''.join(selection), ()))
+
+        return found
+
+    def search(self, word: str, radius: int, limit: Optional[int] = None) -> Optional[List[Tuple[str, int]]]:
+        """
+        Find keys sharing a root with the word within a maximum edit distance
+
+        Args:
+            word: Query word
+            radius: Maximum Levenshtein distance (inclusive)
+            limit: Keep only this many closest words (None = all)
+
+        Returns:
+            List of (word, distance) tuples sorted by distance, then word, or
+            None when no indexed root occurs in the word
+        """
+        candidates = self.candidates(word)
+        if not candidates:
+            return None
+
+        top = TopK(limit, radius)
+        for candidate in candidates:
+            top.offer(candidate, levenshtein_distance(word, candidate, score_cutoff=top.radius))
+
+        self.distance_calls += len(candidates)
+        return top.results()
+
+    def __len__(self) -> int:
+        return len(self.root_keys)
+
+
+class KeyMatrix:
+    """
+    Deck keys as a padded code-point matrix for vectorized edit distances
+
+    Keys are sorted by length so the rows within reach of a query's length
+    form one contiguous slice, scored together by a banded DP that advances
+    all rows at once.
+    """
+
+    def __init__(self, words: Iterable[str] = ()):
+        if np is None:
+            raise ImportError("The numpy match engine requires numpy (pip install numpy)")
+
+        self.words: List[str] = sorted(set(words), key=lambda w: (len(w), w))
+        self.lengths = np.array([len(word) for word in self.words], dtype=np.int32)
+        width = int(self.lengths[-1]) if self.words else 0
+
+        # Column-major (position, row) so each DP step reads one contiguous code row
+        self.codes = np.zeros((width, len(self.words)), dtype=np.uint32)
+        for row, word in enumerate(self.words):
+            self.codes[:len(word), row] = [ord(char) for char in word]
+
+        self.distance_calls = 0  # Rows scored on searches (one distance each)
+
+    def distances(self, word: str, radius: int, start: int, end: int) -> "np.ndarray":
+        """
+        Bounded edit distances from word to rows start:end
+
+        Cells further than radius off the diagonal can only exceed the radius,
+        so each query character updates just the 2 * radius + 1 band cells.
+
+        Returns:
+            Distances per row, with anything beyond radius reported as radius + 1
+        """
+        cap = radius + 1
+        rows = end - start
+        width = min(self.codes.shape[0], len(word) + radius)
+        codes = self.codes[:width, start:end]
+
+        # previous[j] = distance from the query prefix to the first j key characters
+        previous = np.minimum(np.arange(width + 1, dtype=np.int16), cap)[:, None].repeat(rows, axis=1)
+        for i, char in enumerate(word, start=1):
+            current = np.full((width + 1, rows), cap, dtype=np.int16)
+            current[0] = min(i, cap)
+            code = ord(char)
+
+            for j in range(max(1, i - radius), min(width, i + radius) + 1):
+                best = previous[j - 1] + (codes[j - 1] != code)
+                np.minimum(best, previous[j] + 1, out=best)
+                np.minimum(best, current[j - 1] + 1, out=best)
+                np.minimum(best, cap, out=current[j])
+            previous = current
+
+        return previous[self.lengths[start:end], np.arange(rows)]
+
+    def search(self, word: str, radius: int, limit: Optional[int] = None) -> List[Tuple[str, int]]:
+        """
+        Find keys within a maximum edit distance
+
+        Args:
+            word: Query word
+            radius: Maximum Levenshtein distance (inclusive)
+            limit: Keep only this many closest words (None = all)
+
+        Returns:
+            List of (word, distance) tuples sorted by distance, then word
+        """
+        # Only keys whose length is within radius of the query can match
+        start = int(np.searchsorted(self.lengths, len(word) - radius, side='left'))
+        end = int(np.searchsorted(self.lengths, len(word) + radius, side='right'))
+        if start >= end:
+            return []
+
+        distances = self.distances(word, radius, start, end)
+        self.distance_calls += end - start
+
+        hits = sorted((int(distances[row]), self.words[start + row])
+                      for row in np.flatnonzero(distances <= radius))
+        return [(key, distance) for distance, key in hits[:limit]]
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+
+if __name__ == "__main__":
+    # Benchmark index searches against a linear scan on a synthetic deck
+    import random
+    import time
+    from queue import PriorityQueue
+
+    random.seed(0)
+    letters = [chr(c) for c in range(0x05d0, 0x05eb)]
+
+    def random_word() -> str:
+        return "".join(random.choice(letters) for _ in range(random.randint(2, 8)))
+
+    deck_keys = list({random_word() for _ in range(50000)})
+    queries = [random_word() for _ in range(200)]
+    print(f"Synthetic deck: {len(deck_keys)} distinct keys, {len(queries)} queries")
+
+    start = time.perf_counter()
+    tree = BKTree(deck_keys)
+    print(f"BK-tree build: {time.perf_counter() - start:.2f}s")
+
+    for radius in (1, 2, 3):
+        start = time.perf_counter()
+        linear_hits = 0
+        for query in queries:
+            linear_hits += sum(1 for key in deck_keys if levenshtein_distance(query, key) <= radius)
+        linear_time = time.perf_counter() - start
+        linear_calls = len(deck_keys) * len(queries)
+
+        tree.distance_calls = 0
+        start = time.perf_counter()
+        tree_hits = sum(len(tree.search(query, radius)) for query in queries)
+        tree_time = time.perf_counter() - start
+
+        assert tree_hits == linear_hits
+        print(f"radius {radius}: linear {linear_calls} calls / {linear_time:.2f}s, "
+              f"BK-tree {tree.distance_calls} calls / {tree_time:.2f}s "
+              f"({linear_calls / max(tree.distance_calls, 1):.1f}x fewer calls)")
+
+        if radius <= 2:
+            start = time.perf_counter()
+            deletion_index = DeletionIndex(deck_keys, max_depth=radius)
+            build_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            index_hits = sum(len(deletion_index.search(query, radius)) for query in queries)
+            index_time = time.perf_counter() - start
+
+            assert index_hits == linear_hits
+            print(f"radius {radius}: deletion index {deletion_index.distance_calls} calls / "
+                  f"{index_time * 1000 / len(queries):.3f}ms per query "
+                  f"(build {build_time:.2f}s, {len(deletion_index.deletes)} variants)")
+
+    # Top-k selection versus collecting and ordering every in-range word
+    # (v2 matching pushes each one through a PriorityQueue)
+    k, radius = 3, 3
+    start = time.perf_counter()
+    for query in queries:
+        queue = PriorityQueue()
+        for key in deck_keys:
+            distance = levenshtein_distance(query, key)
+            if distance <= radius:
+                queue.put((distance, key))
+        queued = [queue.get() for _ in range(min(k, queue.qsize()))]
+    queue_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for query in queries:
+        top = TopK(k, radius)
+        for key in deck_keys:
+            top.offer(key, levenshtein_distance(query, key, score_cutoff=top.radius))
+    top_time = time.perf_counter() - start
+    print(f"top-{k} linear scan: PriorityQueue {queue_time:.2f}s, TopK with cut-off {top_time:.2f}s")
+
+    tree.distance_calls = 0
+    start = time.perf_counter()
+    for query in queries:
+        tree.search(query, radius)
+    full_calls, full_time = tree.distance_calls, time.perf_counter() - start
+
+    tree.distance_calls = 0
+    start = time.perf_counter()
+    for query in queries:
+        tree.search(query, radius, limit=k)
+    print(f"top-{k} BK-tree: full {full_calls} calls / {full_time:.2f}s, "
+          f"bounded {tree.distance_calls} calls / {time.perf_counter() - start:.2f}s")
+
+    # Root-narrowed candidates on a deck of words derived from triliteral roots
+    patterns = ["{0}{1}{2}", "{0}ו{1}{2}", "מ{0}{1}{2}", "{0}{1}י{2}ה", "ה{0}{1}{2}ים", "נ{0}{1}{2}ת"]
+    roots = list({"".join(random.choice(letters) for _ in range(3)) for _ in range(8000)})
+    root_keys = {root: [pattern.format(*root) for pattern in patterns] for root in roots}
+    rooted_keys = sorted({key for keys in root_keys.values() for key in keys})
+    rooted_queries = [random.choice(root_keys[random.choice(roots)]) + random.choice(letters)
+                      for _ in range(len(queries))]
+
+    root_index = RootIndex(root_keys)
+    start = time.perf_counter()
+    for query in rooted_queries:
+        top = TopK(k, radius)
+        for key in rooted_keys:
+            top.offer(key, levenshtein_distance(query, key, score_cutoff=top.radius))
+    scan_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for query in rooted_queries:
+        root_index.search(query, radius, limit=k)
+    print(f"top-{k} rooted deck ({len(rooted_keys)} keys): scan {len(rooted_keys) * len(rooted_queries)} calls / "
+          f"{scan_time:.2f}s, root index {root_index.distance_calls} calls / {time.perf_counter() - start:.2f}s")
+
+    if np is not None:
+        # Vectorized banded DP: check against Levenshtein.distance, then time it
+        start = time.perf_counter()
+        matrix = KeyMatrix(deck_keys)
+        print(f"Key matrix build: {time.perf_counter() - start:.2f}s ({matrix.codes.nbytes / 1e6:.1f} MB)")
+
+        for radius in (1, 2, 3):
+            for query in queries[:20]:
+                expected = sorted((levenshtein_distance(query, key), key) for key in deck_keys
+                                  if levenshtein_distance(query, key) <= radius)
+                assert matrix.search(query, radius) == [(key, distance) for distance, key in expected]
+
+            start = time.perf_counter()
+            for query in queries:
+                top = TopK(k, radius)
+                for key in deck_keys:
+                    top.offer(key, levenshtein_distance(query, key, score_cutoff=top.radius))
+            scan_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            for query in queries:
+                matrix.search(query, radius, limit=k)
+            matrix_time = time.perf_counter() - start
+            print(f"top-{k} radius {radius}: TopK scan {len(queries) / scan_time:.0f} queries/s, "
+                  f"key matrix {len(queries) / matrix_time:.0f} queries/s")
+
+    # End to end: AnkiMatcher.find_matches over the same deck with each engine.
+    # The BK-tree loses to the length-bucketed scan from radius 2 up (most of the
+    # tree is visited and each visit costs a full distance call), so 'auto' never
+    # uses it: a deletion index up to threshold 2, the scan above it.
+    from src.anki_matcher import AnkiMatcher
+    from src.card_store import CardStore
+
+    store = CardStore()
+    for card_id, key in enumerate(deck_keys, 1):
+        store.add(card_id, card_id, key, f"meaning {card_id}", key, [], {'Hebrew': key})
+    distinct_queries = list(dict.fromkeys(queries))
+    engines = [engine for engine in AnkiMatcher.MATCH_ENGINES if engine != 'numpy' or np is not None]
+
+    for threshold in (1, 2, 3):
+        timings, results = [], {}
+        for engine in engines:
+            matcher = AnkiMatcher('benchmark', threshold, use_cache=False, match_engine=engine)
+            start = time.perf_counter()
+            matcher.load_card_store(store)
+            build_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            results[engine] = [[(m.anki_card.card_id, m.similarity_score) for m in matcher.find_matches(query, k)]
+                               for query in distinct_queries]
+            match_time = time.perf_counter() - start
+            timings.append(f"{engine} {match_time * 1000 / len(distinct_queries):.2f}ms (load {build_time:.2f}s)")
+            assert results[engine] == results[engines[0]], engine
+        print(f"find_matches threshold {threshold}, per query: " + ", ".join(timings))
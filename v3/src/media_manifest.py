@@ -0,0 +1,95 @@
+"""
+Content-hash manifest of media files uploaded to Anki
+Records size, mtime and SHA-1 of each file as last uploaded, so changed
+recordings are re-sent and Anki's copies can be checked for drift
+"""
+import hashlib
+import json
+from pathlib import Path
+from typing import Dict, Iterable, Set
+
+HASH_CHUNK_SIZE = 1 << 20
+
+
+def file_digest(path: Path) -> str:
+    """SHA-1 of a file's content"""
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def get_media_manifest_file(course_dir: Path) -> Path:
+    """Get path to the media manifest, kept next to the media mapping file"""
+    course_name = course_dir.name.replace(" ", "_").replace("/", "_")
+    return Path("data") / f"media_manifest_{course_name}.json"
+
+
+class MediaManifest:
+    """Anki filename -> {size, mtime, sha1} of the local file as last uploaded"""
+
+    def __init__(self, manifest_file: Path):
+        self.manifest_file = manifest_file
+        self.files: Dict[str, Dict] = {}
+        self.dirty = False
+
+        if manifest_file.exists():
+            with open(manifest_file, 'r', encoding='utf-8') as f:
+                self.files = json.load(f)
+
+    def local_entry(self, filename: str, path: Path) -> Dict:
+        """
+        Size, mtime and hash of a local file
+
+        The hash recorded for filename is reused while size and mtime match,
+        so unchanged files are only stat'ed.
+        """
+        stat = path.stat()
+        recorded = self.files.get(filename)
+        if recorded and recorded['size'] == stat.st_size and recorded['mtime'] == stat.st_mtime:
+            return recorded
+        return {'size': stat.st_size, 'mtime': stat.st_mtime, 'sha1': file_digest(path)}
+
+    def record(self, filename: str, entry: Dict):
+        """Remember entry as the content Anki now holds for filename"""
+        if self.files.get(filename) != entry:
+            self.files[filename] = entry
+            self.dirty = True
+
+    def find_changed(self, filenames: Iterable[str], media_lookup: Dict[str, Path]) -> Set[str]:
+        """
+        Files already in Anki whose local content differs from what was uploaded
+
+        Files uploaded before the manifest existed are assumed current and
+        recorded; verify-media checks them against Anki's copies.
+        """
+        changed = set()
+        for filename in filenames:
+            path = media_lookup.get(filename)
+            if not path:
+                continue
+
+            try:
+                entry = self.local_entry(filename, path)
+            except FileNotFoundError:
+                continue  # Mapped but deleted locally; Anki's copy is kept
+            recorded = self.files.get(filename)
+            if recorded and recorded['sha1'] != entry['sha1']:
+                changed.add(filename)
+            else:
+                self.record(filename, entry)  # New to the manifest, or only touched
+
+        return changed
+
+    def save(self):
+        """Write the manifest if anything changed"""
+        if not self.dirty:
+            return
+
+        self.manifest_file.parent.mkdir(exist_ok=True)
+        temp_file = self.manifest_file.with_suffix('.json.tmp')
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump(self.files, f, indent=2, ensure_ascii=False, sort_keys=True)
+        temp_file.replace(self.manifest_file)
+        self.dirty = False
@@ -0,0 +1,212 @@
+"""
+Shared MP3 tag cache for audio extraction and word extraction
+Text frames are cached by (path, size, mtime), so an unchanged course is
+read without opening any MP3 file; cache misses are read on a thread pool.
+Only the ID3 tag is parsed, never the MPEG audio frames
+"""
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+from mutagen.id3 import ID3, ID3NoHeaderError
+
+# Text frames used by audio.extract_mp3_metadata (title, album) and WordExtractor
+TEXT_FRAMES = ('TIT2', 'TPE1', 'TALB', 'TPOS')
+METADATA_CACHE_FORMAT = 1
+READ_WORKERS = 8
+
+# Frame id -> text values
+Mp3Tags = Dict[str, List[str]]
+
+
+def read_mp3_tags(mp3_path) -> Mp3Tags:
+    """
+    Read the cached text frames of one MP3 file
+
+    Uses mutagen's ID3 reader, which reads the tag at the start of the file
+    (and an ID3v1 tag at its end) without scanning audio frames for the
+    bitrate and length that MP3() computes.
+
+    Args:
+        mp3_path: File path or binary file object
+    """
+    try:
+        tags = ID3(mp3_path)
+    except ID3NoHeaderError:
+        return {}
+    return {frame: [str(text) for text in tags[frame].text]
+            for frame in TEXT_FRAMES if frame in tags}
+
+
+class Mp3MetadataCache:
+    """MP3 path -> {size, mtime, tags}, persisted as JSON in the data directory"""
+
+    def __init__(self, cache_file: Path = Path("data") / "mp3_metadata_cache.json"):
+        self.cache_file = Path(cache_file)
+        self.entries: Dict[str, Dict] = {}
+        self.checked: Set[str] = set()  # Paths stat'ed by this instance, served without another stat
+        self.dirty = False
+        self.hits = 0
+        self.reads = 0
+
+        if self.cache_file.exists():
+            try:
+                with open(self.cache_file, 'r', encoding='utf-8') as f:
+                    stored = json.load(f)
+                if stored.get('format') == METADATA_CACHE_FORMAT:
+                    self.entries = stored['files']
+            except (OSError, ValueError) as e:
+                print(f"Ignoring unreadable MP3 metadata cache: {e}")
+
+    def get_tags(self, mp3_files: Iterable[Path], workers: int = READ_WORKERS) -> Dict[Path, Optional[Mp3Tags]]:
+        """
+        Text frames of each file, reading only files that are new or changed
+
+        Files already checked by this instance are not stat'ed again, so a
+        pre-pass over all lessons followed by per-lesson lookups costs one
+        stat per file.
+
+        Args:
+            mp3_files: MP3 files to look up
+            workers: Threads reading cache misses
+
+        Returns:
+            Path -> frame id -> text values (None if the file could not be read)
+        """
+        results: Dict[Path, Optional[Mp3Tags]] = {}
+        misses = []
+
+        for mp3_file in mp3_files:
+            if str(mp3_file) in self.checked:
+                results[mp3_file] = self.entries[str(mp3_file)]['tags']
+                continue
+
+            self.checked.add(str(mp3_file))
+            stat = mp3_file.stat()
+            entry = self.entries.get(str(mp3_file))
+            if entry and entry['size'] == stat.st_size and entry['mtime'] == stat.st_mtime:
+                results[mp3_file] = entry['tags']
+                self.hits += 1
+            else:
+                misses.append((mp3_file, stat))
+
+        if misses:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                tags_read = pool.map(self._read_tags, [mp3_file for mp3_file, _ in misses])
+                for (mp3_file, stat), tags in zip(misses, tags_read):
+                    results[mp3_file] = tags
+                    self.entries[str(mp3_file)] = {'size': stat.st_size, 'mtime': stat.st_mtime, 'tags': tags}
+            self.reads += len(misses)
+            self.dirty = True
+
+        return results
+
+    @staticmethod
+    def _read_tags(mp3_file: Path) -> Optional[Mp3Tags]:
+        """read_mp3_tags, with unreadable files cached as None until they change"""
+        try:
+            return read_mp3_tags(mp3_file)
+        except Exception as e:
+            print(f"Error reading tags from {mp3_file}: {e}")
+            return None
+
+    def _stale_entries(self) -> List[str]:
+        """
+        Unseen entries whose file no longer exists
+
+        Each lesson directory holding unseen entries is listed once with
+        scandir, rather than stat'ing every file of the lessons a run skipped.
+        """
+        unseen_by_dir: Dict[str, List[str]] = {}
+        for path in self.entries:
+            if path not in self.checked:
+                unseen_by_dir.setdefault(os.path.dirname(path), []).append(path)
+
+        stale = []
+        for directory, paths in unseen_by_dir.items():
+            try:
+                with os.scandir(directory or '.') as entries:
+                    names = {entry.name for entry in entries}
+            except FileNotFoundError:
+                names = set()
+            stale.extend(path for path in paths if os.path.basename(path) not in names)
+        return stale
+
+    def save(self):
+        """
+        Write the cache if any file was read or removed
+
+        Entries for files not looked up by this instance are dropped once the
+        file is gone (deleted or renamed). Unseen files that still exist are
+        kept, since audio extraction and word extraction cover different
+        lesson ranges with the same cache file.
+        """
+        stale = self._stale_entries()
+        for path in stale:
+            del self.entries[path]
+        if not self.dirty and not stale:
+            return
+
+        self.cache_file.parent.mkdir(exist_ok=True)
+        temp_file = self.cache_file.with_suffix('.json.tmp')
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump({'format': METADATA_CACHE_FORMAT, 'files': self.entries}, f, ensure_ascii=False)
+        os.replace(temp_file, self.cache_file)
+        self.dirty = False
+
+
+if __name__ == "__main__":
+    # Bytes read and time per file: full MP3 parse versus the ID3-only reader, over synthetic fixtures
+    import io
+    import tempfile
+    import time
+    from mutagen.id3 import TALB, TIT2, TPE1
+    from mutagen.mp3 import MP3
+
+    class CountingReader(io.FileIO):
+        """Binary file that counts the bytes read through it"""
+        bytes_read = 0
+
+        def read(self, size=-1):
+            data = super().read(size)
+            CountingReader.bytes_read += len(data)
+            return data
+
+        def readinto(self, buffer):
+            count = super().readinto(buffer)
+            CountingReader.bytes_read += count or 0
+            return count
+
+    mpeg_frame = b'\xff\xfb\x90\x64' + b'\x00' * 413  # MPEG-1 Layer III, 128 kbps, 44.1 kHz
+    with tempfile.TemporaryDirectory() as fixture_dir:
+        fixtures = []
+        for i in range(200):
+            fixture = Path(fixture_dir) / f"S{i:03d}.mp3"
+            fixture.write_bytes(mpeg_frame * 1500)  # About 40 s of audio, 625 KB
+            tags = ID3()
+            tags.add(TIT2(encoding=3, text=[f"S{i:02d}-שלום, מה שלומך {i}"]))
+            tags.add(TALB(encoding=3, text=["Hebrew Assimil - L001"]))
+            tags.add(TPE1(encoding=3, text=["Assimil"]))
+            tags.save(fixture)
+            fixtures.append(fixture)
+
+        def full_parse(fileobj) -> Mp3Tags:
+            audio = MP3(fileobj)
+            return {frame: [str(text) for text in audio.tags[frame].text]
+                    for frame in TEXT_FRAMES if frame in audio.tags}
+
+        results = {}
+        for name, reader in (("MP3() full parse", full_parse), ("ID3 tag only", read_mp3_tags)):
+            CountingReader.bytes_read = 0
+            start = time.perf_counter()
+            results[name] = []
+            for fixture in fixtures:
+                with CountingReader(fixture) as f:
+                    results[name].append(reader(f))
+            elapsed = time.perf_counter() - start
+            print(f"{name}: {elapsed / len(fixtures) * 1e6:.0f} us/file, "
+                  f"{CountingReader.bytes_read / len(fixtures) / 1024:.1f} KB read/file")
+
+        assert results["MP3() full parse"] == results["ID3 tag only"]
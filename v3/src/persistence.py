@@ -3,9 +3,12 @@ Persistent storage system for word matches and processing state
 Similar to V2's approach with approved matches, extra matches, and unmatched tracking
 """
 
+import atexit
 import csv
+import os
+import sqlite3
 from pathlib import Path
-from typing import Dict, List, Set, Optional, Tuple
+from typing import Dict, Iterable, List, Set, Optional, Tuple
 from dataclasses import dataclass
 
 from src.tokenizer import normalize_hebrew_word
@@ -48,10 +51,33 @@ class PersistenceManager:
         self.approved_matches: Dict[str, StoredMatch] = {}
         self.extra_matches: Dict[str, StoredMatch] = {}
         self.unmatched_words: Dict[str, UnmatchedWord] = {}
+        self._unmatched_dirty = False  # Unmatched words changed since the last flush
 
         # Load existing data
+        self._open_storage()
+
+        # Write buffered updates even if the caller never flushes
+        atexit.register(self.flush)
+
+    def _open_storage(self):
+        """Load stored state once the file paths are set (the CSV files here)"""
         self._load_all_files()
 
+    def __enter__(self) -> 'PersistenceManager':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.flush()
+
+    def flush(self) -> bool:
+        """Write buffered unmatched-word updates in one atomic file write"""
+        if not self._unmatched_dirty:
+            return True
+        if not self._save_unmatched_words():
+            return False
+        self._unmatched_dirty = False
+        return True
+
     def _load_all_files(self):
         """Load all persistent files into memory"""
         self._load_approved_matches()
@@ -141,6 +167,11 @@ class PersistenceManager:
         normalized = normalize_hebrew_word(heb_word)
         return f"L{lesson:03d}:{normalized}"
 
+    def get_unmatched_words(self, limit: Optional[int] = None) -> List[UnmatchedWord]:
+        """Unmatched words in insertion order (the first limit of them if given)"""
+        words = list(self.unmatched_words.values())
+        return words[:limit] if limit is not None else words
+
     def is_word_processed(self, lesson: int, heb_word: str) -> bool:
         """Check if word has already been processed (approved, extra, or marked unmatched)"""
         key = self._make_word_key(lesson, heb_word)
@@ -164,21 +195,7 @@ class PersistenceManager:
                 key = self._make_word_key(match.lesson, match.heb_word)
                 self.approved_matches[key] = match
 
-            # Write all approved matches
-            with open(self.approved_file, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                writer.writerow(['lesson', 'heb_word', 'match_word', 'match_word_def', 'score', 'card_id'])
-
-                for match in self.approved_matches.values():
-                    writer.writerow([
-                        match.lesson,
-                        match.heb_word,
-                        match.anki_hebrew,
-                        match.anki_english,
-                        match.score,
-                        match.card_id
-                    ])
-
+            self._write_approved_file()
             print(f"Saved {len(self.approved_matches)} approved matches to {self.approved_file}")
             return True
 
@@ -186,8 +203,25 @@ class PersistenceManager:
             print(f"Error saving approved matches: {e}")
             return False
 
+    def _write_approved_file(self):
+        """Write all approved matches to CSV"""
+        self._write_csv(self.approved_file,
+                        ['lesson', 'heb_word', 'match_word', 'match_word_def', 'score', 'card_id'],
+                        ([match.lesson, match.heb_word, match.anki_hebrew, match.anki_english,
+                          match.score, match.card_id] for match in self.approved_matches.values()))
+
+    @staticmethod
+    def _write_csv(path: Path, header: List[str], rows: Iterable[list]):
+        """Write a CSV file through a temporary file so readers never see a partial one"""
+        temp_path = path.with_suffix('.csv.tmp')
+        with open(temp_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(header)
+            writer.writerows(rows)
+        os.replace(temp_path, path)
+
     def add_unmatched_word(self, lesson: int, heb_word: str, context: str = "") -> bool:
-        """Add a word that couldn't be matched"""
+        """Add a word that couldn't be matched (buffered until flush)"""
         key = self._make_word_key(lesson, heb_word)
 
         if key in self.unmatched_words:
@@ -202,23 +236,15 @@ class PersistenceManager:
                 attempts=1
             )
 
-        return self._save_unmatched_words()
+        self._unmatched_dirty = True
+        return True
 
     def _save_unmatched_words(self) -> bool:
         """Save unmatched words to CSV"""
         try:
-            with open(self.unmatched_file, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                writer.writerow(['lesson', 'heb_word', 'context', 'attempts'])
-
-                for unmatched in self.unmatched_words.values():
-                    writer.writerow([
-                        unmatched.lesson,
-                        unmatched.heb_word,
-                        unmatched.context,
-                        unmatched.attempts
-                    ])
-
+            self._write_csv(self.unmatched_file, ['lesson', 'heb_word', 'context', 'attempts'],
+                            ([unmatched.lesson, unmatched.heb_word, unmatched.context, unmatched.attempts]
+                             for unmatched in self.unmatched_words.values()))
             return True
 
         except Exception as e:
@@ -271,18 +297,263 @@ class PersistenceManager:
         print(f"  Unmatched: {self.unmatched_file}")
 
 
+class SqlitePersistenceManager(PersistenceManager):
+    """
+    Persistent storage in SQLite keyed by (lesson, normalized_word)
+
+    Lookups and updates touch single indexed rows instead of loading and
+    rewriting whole CSV files. The CSV files remain the human-review
+    interface through import_csv / export_csv.
+    """
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS matches (
+        lesson INTEGER NOT NULL,
+        normalized_word TEXT NOT NULL,
+        match_type TEXT NOT NULL,  -- 'approved' or 'extra'
+        heb_word TEXT NOT NULL,
+        anki_hebrew TEXT NOT NULL,
+        anki_english TEXT NOT NULL,
+        card_id INTEGER NOT NULL,
+        score INTEGER NOT NULL,
+        PRIMARY KEY (lesson, normalized_word, match_type)
+    );
+    CREATE TABLE IF NOT EXISTS unmatched (
+        lesson INTEGER NOT NULL,
+        normalized_word TEXT NOT NULL,
+        heb_word TEXT NOT NULL,
+        context TEXT NOT NULL,
+        attempts INTEGER NOT NULL,
+        PRIMARY KEY (lesson, normalized_word)
+    );
+    """
+
+    def __init__(self, data_dir: Path = Path("data")):
+        self.db_file = Path(data_dir) / "assimil-words.sqlite"
+
+        # Unmatched-word updates waiting for flush: (lesson, normalized_word) -> [heb_word, context, attempts]
+        self._pending_unmatched: Dict[Tuple[int, str], list] = {}
+
+        # The CSV files are only used for import/export, and the in-memory
+        # dictionaries are only filled transiently while importing or exporting
+        super().__init__(data_dir)
+
+    def _open_storage(self):
+        """Open the database, seeding a new one from the review files"""
+        is_new = not self.db_file.exists()
+        self.conn = sqlite3.connect(self.db_file)
+        self.conn.executescript(self.SCHEMA)
+
+        # Seed a new database from the review files
+        if is_new:
+            self.import_csv()
+
+        stats = self.get_statistics()
+        print(f"Loaded {stats['approved_matches'] + stats['extra_matches']} stored matches, "
+              f"{stats['unmatched_words']} unmatched words from {self.db_file}")
+
+    def flush(self) -> bool:
+        """Upsert buffered unmatched-word updates in one transaction"""
+        if not self._pending_unmatched:
+            return True
+
+        try:
+            with self.conn:
+                self.conn.executemany(
+                    'INSERT INTO unmatched VALUES (?, ?, ?, ?, ?) '
+                    'ON CONFLICT (lesson, normalized_word) DO UPDATE SET attempts = attempts + excluded.attempts',
+                    [(*key, *update) for key, update in self._pending_unmatched.items()]
+                )
+            self._pending_unmatched = {}
+            return True
+
+        except sqlite3.Error as e:
+            print(f"Error saving unmatched words: {e}")
+            return False
+
+    def _key_parts(self, lesson: int, heb_word: str) -> Tuple[int, str]:
+        """Indexed (lesson, normalized_word) key for a word"""
+        return lesson, normalize_hebrew_word(heb_word)
+
+    def is_word_processed(self, lesson: int, heb_word: str) -> bool:
+        """Check if word has already been processed (approved, extra, or marked unmatched)"""
+        key = self._key_parts(lesson, heb_word)
+        if key in self._pending_unmatched:
+            return True
+
+        row = self.conn.execute(
+            'SELECT 1 FROM matches WHERE lesson = ? AND normalized_word = ? '
+            'UNION ALL SELECT 1 FROM unmatched WHERE lesson = ? AND normalized_word = ? LIMIT 1',
+            key + key
+        ).fetchone()
+        return row is not None
+
+    def get_processed_words(self) -> Set[str]:
+        """Get all processed word keys to filter suggestions"""
+        self.flush()
+        rows = self.conn.execute('SELECT lesson, normalized_word FROM matches '
+                                 'UNION SELECT lesson, normalized_word FROM unmatched')
+        return {f"L{lesson:03d}:{normalized}" for lesson, normalized in rows}
+
+    def save_approved_matches(self, matches: List[StoredMatch]) -> bool:
+        """Upsert approved matches in one transaction"""
+        try:
+            with self.conn:
+                self._upsert_matches(matches, 'approved')
+            print(f"Saved {len(matches)} approved matches to {self.db_file}")
+            return True
+
+        except sqlite3.Error as e:
+            print(f"Error saving approved matches: {e}")
+            return False
+
+    def _upsert_matches(self, matches: List[StoredMatch], match_type: str):
+        """Insert or replace matches of one type (caller holds the transaction)"""
+        self.conn.executemany(
+            'INSERT OR REPLACE INTO matches VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+            [(*self._key_parts(match.lesson, match.heb_word), match_type, match.heb_word,
+              match.anki_hebrew, match.anki_english, match.card_id, match.score)
+             for match in matches]
+        )
+
+    def add_unmatched_word(self, lesson: int, heb_word: str, context: str = "") -> bool:
+        """Add a word that couldn't be matched, or count another attempt at it (buffered until flush)"""
+        key = self._key_parts(lesson, heb_word)
+        update = self._pending_unmatched.get(key)
+
+        if update:
+            update[2] += 1
+        else:
+            self._pending_unmatched[key] = [heb_word, context, 1]
+        return True
+
+    def get_unmatched_words(self, limit: Optional[int] = None) -> List[UnmatchedWord]:
+        """Unmatched words in insertion order (the first limit of them if given)"""
+        self.flush()
+        rows = self.conn.execute('SELECT lesson, heb_word, context, attempts FROM unmatched '
+                                 'ORDER BY rowid LIMIT ?', (-1 if limit is None else limit,))
+        return [UnmatchedWord(*row) for row in rows]
+
+    def import_csv(self) -> Dict[str, int]:
+        """
+        Replace the database contents with the CSV files
+
+        Rows removed from the files during review are removed from the
+        database too; the delete and the inserts share one transaction.
+        """
+        self.flush()
+        self._load_all_files()
+
+        with self.conn:
+            self.conn.execute('DELETE FROM matches')
+            self.conn.execute('DELETE FROM unmatched')
+            self._upsert_matches(list(self.approved_matches.values()), 'approved')
+            self._upsert_matches(list(self.extra_matches.values()), 'extra')
+            self.conn.executemany(
+                'INSERT OR REPLACE INTO unmatched VALUES (?, ?, ?, ?, ?)',
+                [(*self._key_parts(word.lesson, word.heb_word), word.heb_word, word.context, word.attempts)
+                 for word in self.unmatched_words.values()]
+            )
+
+        counts = {'approved_matches': len(self.approved_matches), 'extra_matches': len(self.extra_matches),
+                  'unmatched_words': len(self.unmatched_words)}
+        self.approved_matches, self.extra_matches, self.unmatched_words = {}, {}, {}
+        return counts
+
+    def export_csv(self) -> Dict[str, int]:
+        """
+        Write approved matches and unmatched words back to their CSV files
+
+        The extra matches file is hand-written, so it is left untouched.
+        """
+        self.flush()
+        approved_rows = self.conn.execute(
+            'SELECT lesson, heb_word, anki_hebrew, anki_english, card_id, match_type, score '
+            "FROM matches WHERE match_type = 'approved' ORDER BY rowid")
+        self.approved_matches = {self._make_word_key(row[0], row[1]): StoredMatch(*row) for row in approved_rows}
+        self.unmatched_words = {self._make_word_key(word.lesson, word.heb_word): word
+                                for word in self.get_unmatched_words()}
+
+        self._write_approved_file()
+        self._save_unmatched_words()
+
+        counts = {'approved_matches': len(self.approved_matches), 'unmatched_words': len(self.unmatched_words)}
+        self.approved_matches, self.unmatched_words = {}, {}
+        return counts
+
+    def get_statistics(self) -> Dict[str, int]:
+        """Get statistics about stored data"""
+        self.flush()
+
+        def count(query: str) -> int:
+            return self.conn.execute(query).fetchone()[0]
+
+        return {
+            'approved_matches': count("SELECT COUNT(*) FROM matches WHERE match_type = 'approved'"),
+            'extra_matches': count("SELECT COUNT(*) FROM matches WHERE match_type = 'extra'"),
+            'unmatched_words': count('SELECT COUNT(*) FROM unmatched'),
+            'total_processed': count('SELECT COUNT(*) FROM (SELECT lesson, normalized_word FROM matches '
+                                     'UNION SELECT lesson, normalized_word FROM unmatched)')
+        }
+
+    def print_status(self):
+        """Print current status of persistent storage"""
+        super().print_status()
+        print(f"  Database: {self.db_file}")
+
+
 def create_persistence_manager(config: dict) -> PersistenceManager:
-    """Create PersistenceManager from configuration"""
+    """Create PersistenceManager from configuration (storage.backend: csv or sqlite)"""
     data_dir = Path("data")  # Always use local data directory
+    backend = config.get('storage', {}).get('backend', 'csv')
+
+    if backend == 'sqlite':
+        return SqlitePersistenceManager(data_dir)
+    if backend != 'csv':
+        raise ValueError(f"Unknown storage backend '{backend}', expected 'csv' or 'sqlite'")
     return PersistenceManager(data_dir)
 
 
 if __name__ == "__main__":
-    # Test persistence manager
-    pm = PersistenceManager()
-    pm.create_extra_matches_template()
-    pm.print_status()
-
-    # Test adding unmatched word
-    pm.add_unmatched_word(1, "בוקר", "Good morning context")
-    pm.print_status()
\ No newline at end of file
+    # Count unmatched-file writes during a 1,000-word run, buffered versus flushing per word
+    import random
+    import tempfile
+    import time
+
+    random.seed(0)
+    letters = [chr(c) for c in range(0x05d0, 0x05eb)]
+    words = [(random.randint(1, 100), "".join(random.choice(letters) for _ in range(random.randint(2, 7))))
+             for _ in range(1000)]
+
+    writes = []
+    write_csv = PersistenceManager._write_csv
+
+    def counting_write_csv(path, header, rows):
+        writes.append(path)
+        write_csv(path, header, rows)
+
+    PersistenceManager._write_csv = staticmethod(counting_write_csv)
+
+    for name, manager_class in (("csv", PersistenceManager), ("sqlite", SqlitePersistenceManager)):
+        for flush_each in (True, False):
+            with tempfile.TemporaryDirectory() as data_dir:
+                pm = manager_class(Path(data_dir))
+                writes.clear()
+                start = time.perf_counter()
+
+                with pm:
+                    for lesson, word in words:
+                        pm.add_unmatched_word(lesson, word, "context")
+                        if flush_each:
+                            pm.flush()
+
+                elapsed = time.perf_counter() - start
+                stats = pm.get_statistics()
+                if name == "sqlite":
+                    pm.conn.close()
+
+            label = "flush per word" if flush_each else "buffered"
+            print(f"{name} {label}: {elapsed * 1000:.0f} ms, {len(writes)} file writes, "
+                  f"{stats['unmatched_words']} unmatched words")
+
+    assert len(writes) == 0  # SQLite never rewrites the CSV files
@@ -142,6 +142,57 @@ def normalize_hebrew_word(word: str) -> str:
     normalized = undigraph(normalized)
     return normalized.strip()
 
+def _build_clitic_prefixes() -> Tuple[str, ...]:
+    """
+    Build the attachable prefix sequences of written Hebrew
+
+    Prefixes stack in a fixed order: conjunction ו, then a relativizer
+    (ש, כש, מש), then one of ה/ב/ל/מ/כ - e.g. ו+ש+ב in "ושבבית".
+    """
+    prefixes = set()
+    for conjunction in ("", "ו"):
+        for relativizer in ("", "ש", "כש", "מש"):
+            for particle in ("", "ה", "ב", "ל", "מ", "כ"):
+                prefix = conjunction + relativizer + particle
+                if prefix:
+                    prefixes.add(prefix)
+
+    # Shortest first: the least de-cliticized reading is the most plausible
+    return tuple(sorted(prefixes, key=lambda p: (len(p), p)))
+
+HEBREW_CLITIC_PREFIXES = _build_clitic_prefixes()
+
+def decliticize_variants(word: str, min_stem_length: int = 3) -> List[Tuple[str, str]]:
+    """
+    Generate plausible readings of a word with attached prefixes removed
+
+    Args:
+        word: Normalized Hebrew word (no nikud)
+        min_stem_length: Shortest stem worth looking up (two-letter stems match
+            unrelated short words, e.g. לחם -> ל + חם)
+
+    Returns:
+        List of (prefix, stem) tuples, shortest prefix first
+    """
+    return [
+        (prefix, word[len(prefix):])
+        for prefix in HEBREW_CLITIC_PREFIXES
+        if word.startswith(prefix) and len(word) - len(prefix) >= min_stem_length
+    ]
+
+# Final letter forms (ך ם ן ף ץ) folded to their regular forms
+_FINAL_LETTERS = str.maketrans("\u05da\u05dd\u05df\u05e3\u05e5", "\u05db\u05de\u05e0\u05e4\u05e6")
+
+def root_letters(text: str) -> str:
+    """
+    Reduce text to bare Hebrew letters for root comparison
+
+    Nikud, maqaf and separators are dropped and final forms folded, so
+    "שׁ־ע־ר", "ש::ע::ר" and the letters of "שערים" compare alike.
+    """
+    letters = re.sub(r"[^\u05d0-\u05ea]", "", normalize_hebrew_word(text))
+    return letters.translate(_FINAL_LETTERS)
+
 if __name__ == "__main__":
     # Test with sample Hebrew text
     test_text = "בוקר טוב! איך אתה?"
@@ -47,10 +47,11 @@ def find_anki_card_id(hebrew_word: str) -> Optional[int]:
 class V1Importer:
     """Import V1 match data into V3 persistence system"""
 
-    def __init__(self, v1_dir: Path = Path("../v1"), target_deck: str = "Hebrew from Scratch"):
+    def __init__(self, v1_dir: Path = Path("../v1"), target_deck: str = "Hebrew from Scratch",
+                 persistence: Optional[PersistenceManager] = None):
         self.v1_dir = Path(v1_dir)
         self.target_deck = target_deck
-        self.persistence = PersistenceManager()
+        self.persistence = persistence or PersistenceManager()
 
     def import_approved_matches(self, dry_run: bool = True) -> Dict[str, int]:
         """
@@ -245,9 +246,9 @@ class V1Importer:
         return total_stats
 
 
-def import_v1_data(dry_run: bool = True) -> Dict[str, any]:
+def import_v1_data(dry_run: bool = True, persistence: Optional[PersistenceManager] = None) -> Dict[str, any]:
     """Convenience function to import V1 data"""
-    importer = V1Importer()
+    importer = V1Importer(persistence=persistence)
     return importer.import_all(dry_run)
 
 
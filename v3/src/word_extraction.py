@@ -7,9 +7,7 @@ import re
 from pathlib import Path
 from typing import Dict, List, Set, Tuple, Optional
 from dataclasses import dataclass
-from mutagen.mp3 import MP3
-from mutagen.id3 import ID3NoHeaderError
-
+from src.mp3_metadata import Mp3MetadataCache, Mp3Tags, read_mp3_tags
 from src.tokenizer import extract_hebrew_words, normalize_hebrew_word
 
 
@@ -39,18 +37,20 @@ class WordExtractor:
         self.course_dir = Path(course_dir)
         self.seen_words: Set[str] = set()  # Normalized words we've seen
         self.lesson_words: Dict[int, List[LessonWord]] = {}
+        self.metadata_cache = Mp3MetadataCache()
 
-    def extract_text_from_mp3(self, mp3_path: Path) -> Optional[str]:
-        """Extract Hebrew text from MP3 metadata"""
+    def extract_text_from_mp3(self, mp3_path: Path, tags: Optional[Mp3Tags] = None) -> Optional[str]:
+        """Extract Hebrew text from MP3 metadata (tags already read for the file, if given)"""
         try:
-            audio = MP3(mp3_path)
+            if tags is None:
+                tags = read_mp3_tags(mp3_path)
             # Try different ID3 tags that might contain Hebrew text
             for tag in ['TIT2', 'TPE1', 'TALB', 'TPOS']:
-                if tag in audio:
-                    text = str(audio[tag])
+                if tag in tags:
+                    text = '\u0000'.join(tags[tag])
                     if text and any('\u05d0' <= c <= '\u05ea' for c in text):
                         return text.strip()
-        except (ID3NoHeaderError, Exception):
+        except Exception:
             pass
         return None
 
@@ -68,15 +68,14 @@ class WordExtractor:
         phrases = []
         audio_files = []
 
-        # Process all MP3 files in lesson directory
-        mp3_files = sorted(lesson_dir.glob('*.mp3'))
+        # Process all MP3 files in lesson directory, skipping translation files as specified in config
+        mp3_files = [mp3_file for mp3_file in sorted(lesson_dir.glob('*.mp3'))
+                     if 'T00-TRANSLATE' not in mp3_file.name]
+        tags_by_file = self.metadata_cache.get_tags(mp3_files)
 
         for mp3_file in mp3_files:
-            # Skip translation files as specified in config
-            if 'T00-TRANSLATE' in mp3_file.name:
-                continue
-
-            hebrew_text = self.extract_text_from_mp3(mp3_file)
+            tags = tags_by_file[mp3_file]
+            hebrew_text = self.extract_text_from_mp3(mp3_file, tags) if tags is not None else None
             if hebrew_text:
                 phrases.append(hebrew_text)
                 audio_files.append(mp3_file.name)
@@ -142,12 +141,17 @@ class WordExtractor:
         if max_lessons:
             lesson_dirs = lesson_dirs[:max_lessons]
 
+        # Read tags of new or changed files for all lessons in one pool before processing them in order
+        self.metadata_cache.get_tags(mp3_file for lesson_dir in lesson_dirs for mp3_file in lesson_dir.glob('*.mp3')
+                                     if 'T00-TRANSLATE' not in mp3_file.name)
+
         for lesson_dir in lesson_dirs:
             lesson_data = self.process_lesson_directory(lesson_dir)
             if lesson_data:
                 lessons_data[lesson_data.lesson_num] = lesson_data
                 self.lesson_words[lesson_data.lesson_num] = lesson_data.words
 
+        self.metadata_cache.save()
         return lessons_data
 
     def get_new_words_by_lesson(self, lesson_num: int) -> List[LessonWord]:
@@ -8,6 +8,7 @@ from pathlib import Path
 
 from src.word_extraction import WordExtractor, LessonWord, extract_words_from_config
 from src.anki_matcher import AnkiMatcher, WordMatch, create_matcher_from_config
+from src.card_store import load_card_details
 from src.anki_api import anki_request
 from src.persistence import PersistenceManager, StoredMatch, create_persistence_manager
 
@@ -49,55 +50,71 @@ class WordMatchingPipeline:
         print(f"Extracted words from {len(lessons_data)} lessons")
         print("Word extraction stats:", self.word_extractor.get_word_stats())
 
-        # Match each new word to Anki cards, skipping already processed words
-        for lesson_num, lesson_data in lessons_data.items():
-            print(f"\nProcessing lesson {lesson_num}...")
+        # Collect new words across all lessons, skipping already processed words
+        pending_words: Dict[int, List[LessonWord]] = {}
+        skipped_counts: Dict[int, int] = {}
 
-            lesson_matches = []
+        for lesson_num in lessons_data:
             new_words = self.word_extractor.get_new_words_by_lesson(lesson_num)
 
             # Filter out already processed words
-            unprocessed_words = [
+            pending_words[lesson_num] = [
                 word for word in new_words
                 if not self.persistence.is_word_processed(word.lesson, word.word)
             ]
-
-            skipped_count = len(new_words) - len(unprocessed_words)
-            if skipped_count > 0:
-                print(f"  Skipped {skipped_count} already-processed words")
-            print(f"  Found {len(unprocessed_words)} new words to match")
-
-            for lesson_word in unprocessed_words:
-                matches = self.anki_matcher.find_matches(
-                    lesson_word.word,
-                    max_candidates=self.config['processing'].get('similarity_candidates', 3)
-                )
-
-                if matches:
-                    # Use best match (first one after sorting)
-                    best_match = matches[0]
-                    lesson_tag = self._generate_lesson_tag(lesson_num)
-
-                    lesson_word_match = LessonWordMatch(
-                        lesson_word=lesson_word,
-                        word_match=best_match,
-                        lesson_tag=lesson_tag,
-                        should_tag=self._should_tag_card(best_match, lesson_tag)
-                    )
-
-                    lesson_matches.append(lesson_word_match)
-
-                    print(f"    {lesson_word.word} -> {best_match.anki_card.hebrew} ({best_match.match_type}, score: {best_match.similarity_score})")
-                else:
-                    # Track unmatched words
-                    self.persistence.add_unmatched_word(
-                        lesson_num,
-                        lesson_word.word,
-                        lesson_word.context
-                    )
-                    print(f"    {lesson_word.word} -> NO MATCH FOUND (saved to unmatched)")
-
-            self.lesson_matches[lesson_num] = lesson_matches
+            skipped_counts[lesson_num] = len(new_words) - len(pending_words[lesson_num])
+
+        # Match every pending word in one batch so repeated forms are searched once
+        all_words = [word for words in pending_words.values() for word in words]
+        batch_matches = self.anki_matcher.find_matches_batch(
+            [word.word for word in all_words],
+            max_candidates=self.config['processing'].get('similarity_candidates', 3)
+        )
+        all_matches = iter(batch_matches)
+
+        # Best matches are printed and their tags checked; fetch their details in one go
+        load_card_details(matches[0].anki_card for matches in batch_matches if matches)
+
+        # Unmatched words are buffered and written once when the block exits
+        with self.persistence:
+            for lesson_num, unprocessed_words in pending_words.items():
+                print(f"\nProcessing lesson {lesson_num}...")
+
+                lesson_matches = []
+
+                skipped_count = skipped_counts[lesson_num]
+                if skipped_count > 0:
+                    print(f"  Skipped {skipped_count} already-processed words")
+                print(f"  Found {len(unprocessed_words)} new words to match")
+
+                for lesson_word in unprocessed_words:
+                    matches = next(all_matches)
+
+                    if matches:
+                        # Use best match (first one after sorting)
+                        best_match = matches[0]
+                        lesson_tag = self._generate_lesson_tag(lesson_num)
+
+                        lesson_word_match = LessonWordMatch(
+                            lesson_word=lesson_word,
+                            word_match=best_match,
+                            lesson_tag=lesson_tag,
+                            should_tag=self._should_tag_card(best_match, lesson_tag)
+                        )
+
+                        lesson_matches.append(lesson_word_match)
+
+                        print(f"    {lesson_word.word} -> {best_match.anki_card.hebrew} ({best_match.match_type}, score: {best_match.similarity_score})")
+                    else:
+                        # Track unmatched words
+                        self.persistence.add_unmatched_word(
+                            lesson_num,
+                            lesson_word.word,
+                            lesson_word.context
+                        )
+                        print(f"    {lesson_word.word} -> NO MATCH FOUND (saved to unmatched)")
+
+                self.lesson_matches[lesson_num] = lesson_matches
 
         return self.lesson_matches
 
@@ -127,6 +144,9 @@ class WordMatchingPipeline:
             'errors': 0
         }
 
+        load_card_details(match.word_match.anki_card
+                          for matches in self.lesson_matches.values() for match in matches)
+
         for lesson_num, matches in self.lesson_matches.items():
             print(f"\nLesson {lesson_num} tagging:")
 
@@ -166,12 +186,18 @@ class WordMatchingPipeline:
 
         # Count by match type
         exact_matches = 0
+        inflection_matches = 0
+        prefix_matches = 0
         fuzzy_matches = 0
 
         for matches in self.lesson_matches.values():
             for match in matches:
                 if match.word_match.match_type == 'exact':
                     exact_matches += 1
+                elif match.word_match.match_type == 'inflection':
+                    inflection_matches += 1
+                elif match.word_match.match_type == 'prefix':
+                    prefix_matches += 1
                 else:
                     fuzzy_matches += 1
 
@@ -179,6 +205,8 @@ class WordMatchingPipeline:
             'lessons_processed': len(self.lesson_matches),
             'total_word_matches': total_matches,
             'exact_matches': exact_matches,
+            'inflection_matches': inflection_matches,
+            'prefix_matches': prefix_matches,
             'fuzzy_matches': fuzzy_matches,
             'word_extraction_stats': self.word_extractor.get_word_stats(),
             'anki_deck_stats': self.anki_matcher.get_deck_stats(),
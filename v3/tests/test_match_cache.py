@@ -0,0 +1,58 @@
+"""
+Cached match lists served as slices must equal fresh searches
+Run from v3 with: python -m pytest tests
+"""
+
+import pytest
+
+from src.anki_matcher import AnkiMatcher
+from src.card_store import CardStore
+from src.tokenizer import normalize_hebrew_word
+
+# Homographs share a normalized key; each group is added in reverse Hebrew order,
+# so deck order and the final sort order disagree within a key
+HOMOGRAPHS = [
+    ['שָׁלוֹם', 'שְׁלוֹם', 'שִׁלּוּם'],
+    ['שָׁלֵם', 'שִׁלֵּם', 'שֻׁלַּם'],
+    ['סָפַר', 'סִפֵּר', 'סֵפֶר', 'סַפָּר'],
+    ['סְפָרִים', 'סְפָרַיִם'],
+    ['דָּבָר', 'דִּבֵּר', 'דֶּבֶר'],
+    ['מֶלֶךְ', 'מָלַךְ', 'מְלַךְ'],
+]
+
+
+def build_matcher(match_engine: str) -> AnkiMatcher:
+    """Offline matcher over the homograph deck"""
+    store = CardStore()
+    card_id = 0
+    for group in HOMOGRAPHS:
+        for hebrew in sorted(group, reverse=True):
+            card_id += 1
+            store.add(card_id, card_id, hebrew, f"meaning {card_id}", normalize_hebrew_word(hebrew),
+                      [], {'Hebrew': hebrew})
+
+    matcher = AnkiMatcher('homographs', 2, use_cache=False, match_engine=match_engine)
+    matcher.load_card_store(store)
+    return matcher
+
+
+def signature(matches):
+    return [(m.anki_card.card_id, m.similarity_score, m.match_type) for m in matches]
+
+
+@pytest.mark.parametrize('match_engine', ['auto', 'scan', 'bktree'])
+def test_cached_slice_equals_fresh_search(match_engine):
+    fresh = build_matcher(match_engine)
+    cached = build_matcher(match_engine)
+    words = ['שלום', 'שלומ', 'שלם', 'ספר', 'ספרים', 'וספר', 'דבר', 'דברים', 'מלך', 'ומלכ']
+
+    for word in words:
+        cached.find_matches(word, max_candidates=8)
+
+    for word in words:
+        for max_candidates in (1, 2, 3, 5):
+            fresh.match_cache.clear()
+            expected = signature(fresh.find_matches(word, max_candidates))
+            assert signature(cached.find_matches(word, max_candidates)) == expected, (word, max_candidates)
+
+    assert cached.match_stats['cache_misses'] == len(words)